@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 
+import socket
 import sys
-import urllib.request
-import urllib.error
 
-HEALTH_URL = "http://localhost:8080/health"
+HEALTH_HOST = "localhost"
+HEALTH_PORT = 8080
+HEALTH_REQUEST = b"GET /health HTTP/1.0\r\nHost: localhost\r\n\r\n"
 TIMEOUT = 2
 
 
 def main() -> None:
     try:
-        with urllib.request.urlopen(HEALTH_URL, timeout=TIMEOUT) as response:
-            if response.status != 200:
-                sys.exit(1)
-    except (urllib.error.URLError, TimeoutError):
+        with socket.create_connection((HEALTH_HOST, HEALTH_PORT), timeout=TIMEOUT) as sock:
+            sock.sendall(HEALTH_REQUEST)
+            # Only the status line ("HTTP/1.x 200 ...") is needed
+            data = b""
+            while len(data) < 13:
+                chunk = sock.recv(64)
+                if not chunk:
+                    break
+                data += chunk
+    except OSError:
+        sys.exit(1)
+
+    if not (data.startswith(b"HTTP/1.") and data[8:13] == b" 200 "):
         sys.exit(1)
 
 
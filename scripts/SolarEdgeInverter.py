@@ -1,12 +1,12 @@
+import asyncio
 import logging
-import solaredge_modbus
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure the logger
-logging.basicConfig(
-    level=logging.INFO,  # Set the default logging level
-    format="%(asctime)s - %(levelname)s - %(name)s - %(funcName)s - %(message)s",  # Log format
-    datefmt="%Y-%m-%d %H:%M:%S",  # Date format
-)
+import solaredge_modbus
+from pymodbus.constants import Endian
+from pymodbus.exceptions import ModbusException
+from pymodbus.payload import BinaryPayloadDecoder
+from pymodbus.register_read_message import ReadHoldingRegistersResponse
 
 REGISTER_SCALE_FACTORS = {
     "current": "current_scale",
@@ -116,6 +116,39 @@ INVERTER_CONTROL_REGISTERS = [
     "restore_power_control_default_settings",  # 61761 - F101 - Restore Power Control Default Settings
 ]
 
+# Attributes served by the JSON helpers (scale factors are not stored), fixed at import
+_POLL_ATTR_TUPLE = tuple(r for r in INVERTER_POLL_REGISTERS if not r.endswith("_scale"))
+_ALL_JSON_ATTR_TUPLE = tuple(SUNSPEC_REGISTERS) + _POLL_ATTR_TUPLE
+
+# Register name sets and (register, scale factor) pairs, fixed at import
+_SUNSPEC_SET = frozenset(SUNSPEC_REGISTERS)
+_SCALE_PAIRS = tuple(REGISTER_SCALE_FACTORS.items())
+
+# Instance attributes left out of print_all
+_PRINT_EXCLUDE = frozenset({"registers", "battery_dids", "client", "meter_dids", "logger"})
+
+# Powers of ten for SunSpec scale factors
+_POW10 = {i: 10.0 ** i for i in range(-10, 11)}
+
+# Modbus limits a single holding-register read to 125 words
+MAX_BLOCK_WORDS = 125
+# Largest hole (in words) between two registers that is still read as one block
+MAX_BLOCK_GAP = 2
+
+
+# Attributes every instance starts with, all None until the first read (scale factors excluded)
+_INITIAL_VALUES = dict.fromkeys((
+    "c_id", "c_did", "c_length", "c_manufacturer", "c_model", "c_version", "c_serialnumber",
+    "c_deviceaddress", "c_sunspec_did", "c_sunspec_length", "current", "l1_current", "l2_current",
+    "l3_current", "l1_voltage", "l2_voltage", "l3_voltage", "l1n_voltage", "l2n_voltage",
+    "l3n_voltage", "power_ac", "frequency", "power_apparent", "power_reactive", "power_factor",
+    "energy_total", "current_dc", "voltage_dc", "power_dc", "temperature", "status",
+    "vendor_status", "rrcr_state", "active_power_limit", "cosphi", "commit_power_control_settings",
+    "restore_power_control_default_settings", "reactive_power_config",
+    "reactive_power_response_time", "advanced_power_control_enable", "export_control_mode",
+    "export_control_limit_mode", "export_control_site_limit",
+))
+
 
 class SolarEdgeInverter(solaredge_modbus.Inverter):
     def __init__(self, device="/dev/ttyUSB0", baud=9600, timeout=2):
@@ -127,17 +160,18 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
 
         Typically connects via Modbus RTU over a serial interface and then reads all registers, using the get_inverter_data method to populate the class attributes.
         The class provides methods to read and print inverter data, as well as set production limits.
+        The connection is opened here and kept open; call close() (or use the instance as a context manager) when done.
         """
 
         # Setup logging
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing SolarEdgeInverter class...")
 
         try:
             # Call the parent class constructor
             super().__init__(device=device, baud=baud, timeout=timeout)
         except Exception as e:
-            self.logger.error(f"Error initializing SolarEdgeInverter: {e}")
+            self.logger.error("Error initializing SolarEdgeInverter: %s", e)
             raise
         
         # Store device and baud rate
@@ -145,119 +179,185 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         self.baud = baud
         self.timeout = timeout
 
-        # Initialize all values from the example data (except scale factors)
-        self.c_id: str = None
-        self.c_did: str = None
-        self.c_length: str = None
-        self.c_manufacturer: str = None
-        self.c_model: str = None
-        self.c_version: str = None
-        self.c_serialnumber: str = None
-        self.c_deviceaddress: str = None
-        self.c_sunspec_did: str = None
-        self.c_sunspec_length: str = None
-
-        self.current: float = None
-        self.l1_current: float = None
-        self.l2_current: float = None
-        self.l3_current: float = None
-        self.l1_voltage: float = None
-        self.l2_voltage: float = None
-        self.l3_voltage: float = None
-        self.l1n_voltage: float = None
-        self.l2n_voltage: float = None
-        self.l3n_voltage: float = None
-
-        self.power_ac: float = None
-        self.frequency: float = None
-        self.power_apparent: float = None
-        self.power_reactive: float = None
-        self.power_factor: float = None
-        self.energy_total: float = None
-        self.current_dc: float = None
-        self.voltage_dc: float = None
-        self.power_dc: float = None
-        self.temperature: float = None
-        self.status: int = None
-        self.vendor_status: int = None
-        self.rrcr_state: int = None
-        self.active_power_limit: int = None
-        self.cosphi: float = None
-
-        self.commit_power_control_settings: int = None
-        self.restore_power_control_default_settings: int = None
-        self.reactive_power_config: int = None
-        self.reactive_power_response_time: int = None
-        self.advanced_power_control_enable: int = None
-        self.export_control_mode: int = None
-        self.export_control_limit_mode: int = None
-        self.export_control_site_limit: float = None
+        # Initialize all values from the example data (except scale factors) in one dict merge
+        self.__dict__.update(_INITIAL_VALUES)
 
-    def check_connection(self) -> bool:
+        # Register names backed by a plain instance attribute, written via __dict__
+        self._writable = frozenset(
+            key
+            for key in (SUNSPEC_REGISTERS + list(REGISTER_SCALE_FACTORS) + INVERTER_STATUS_REGISTERS + INVERTER_POLL_REGISTERS)
+            if key in self.__dict__
+        )
+        for key in REGISTER_SCALE_FACTORS.keys() - self._writable:
+            self.logger.warning("Warning: Attribute %s not found in class.", key)
+
+        # Per-register constants for the read loops
+        self._scale_pairs = tuple((key, scale_key) for key, scale_key in _SCALE_PAIRS if key in self._writable)
+        self._status_converters = {
+            key: self.registers[key][4]
+            for key in INVERTER_STATUS_REGISTERS
+            if key in self.registers and key in self._writable
+        }
+
+        # Contiguous block reads covering the poll registers
+        self._poll_blocks = self._plan_read_blocks(INVERTER_POLL_REGISTERS)
+
+        # Serializes Modbus operations run from the event loop on the shared client
+        self._io_lock = asyncio.Lock()
+        # All Modbus I/O runs on one dedicated thread instead of the shared default pool
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inverter-io")
+
+        # Open the connection once; it is kept open and only re-established on errors
+        if not self.connect():
+            self.logger.warning("Inverter not reachable yet, will retry on first request.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
         """
-        Checks the connection to the inverter.
-        :return: True if connected, False otherwise.
+        Closes the Modbus connection and stops the I/O thread.
         """
-        self.connect()
-        is_connected = self.connected()
         self.disconnect()
-        return is_connected
+        self._io.shutdown(wait=False)
 
-    async def get_inverter_data(self):
+    def _ensure_connected(self):
         """
-        Connects to the inverter, reads all registers, applies scaling factors,
-        and stores the scaled data in the class attributes.
+        Connects if the connection is not open.
+        :raises ConnectionError: If the inverter cannot be reached.
         """
-        await self.connect()
+        if not self.connected():
+            self.connect()
 
         if not self.connected():
             self.logger.error("Failed to connect to the inverter.")
             raise ConnectionError("Failed to connect to the inverter.")
 
+    def _call(self, func, *args):
+        """
+        Runs one Modbus operation on the open connection, reconnecting and retrying once on Modbus I/O errors.
+        """
+        self._ensure_connected()
+        try:
+            return func(*args)
+        except (ModbusException, IOError) as e:
+            self.logger.warning("Modbus error, reconnecting and retrying: %s", e)
+            self.disconnect()
+            self._ensure_connected()
+            return func(*args)
+
+    def _plan_read_blocks(self, names):
+        """
+        Groups registers into contiguous address ranges that can be read with one request each.
+        :param names: Register names to include.
+        :return: List of (start, count, [(name, offset, length, dtype, vtype), ...]) sorted by address.
+        """
+        layout = sorted((self.registers[name][0], self.registers[name][1], name) for name in names)
+
+        blocks = []
+        for address, length, name in layout:
+            if blocks:
+                start, count, entries = blocks[-1]
+                end = start + count
+                if address - end <= MAX_BLOCK_GAP and address + length - start <= MAX_BLOCK_WORDS:
+                    entries.append((name, address - start, length, self.registers[name][3], self.registers[name][4]))
+                    blocks[-1] = (start, max(end, address + length) - start, entries)
+                    continue
+            blocks.append((address, length, [(name, 0, length, self.registers[name][3], self.registers[name][4])]))
+
+        return blocks
+
+    def _read_block(self, block):
+        """
+        Reads one register block with a single Modbus request and decodes every register in it.
+        :param block: (start, count, entries) as returned by _plan_read_blocks.
+        :return: Dictionary of register name to decoded value.
+        """
+        start, count, entries = block
+        result = self.client.read_holding_registers(start, count, slave=self.unit)
+        if not isinstance(result, ReadHoldingRegistersResponse) or len(result.registers) != count:
+            raise IOError(f"Invalid response for {count} registers at {start}: {result}")
+
+        values = {}
+        for name, offset, length, dtype, vtype in entries:
+            decoder = BinaryPayloadDecoder.fromRegisters(
+                result.registers[offset:offset + length], byteorder=Endian.BIG, wordorder=self.wordorder
+            )
+            values[name] = self._decode_value(decoder, length, dtype, vtype)
+        return values
+
+    async def _run_io(self, func, *args):
+        """
+        Runs one blocking Modbus operation (through _call) on the I/O thread, so the event loop stays responsive.
+        """
+        async with self._io_lock:
+            return await asyncio.get_running_loop().run_in_executor(self._io, self._call, func, *args)
+
+    def _apply_scale_factors(self, registers):
+        """
+        Scales the read registers by their SunSpec scale factors and stores them in the class attributes.
+        :param registers: Dictionary of raw register values, including the scale factor registers.
+        """
+        self.logger.debug("Read scaling factors and setting registers...")
+        attrs = self.__dict__
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for key, scale_key in self._scale_pairs:
+            value = registers.get(key)
+            scale = registers.get(scale_key)
+            if value is None or scale is None:
+                continue
+
+            scale = int(scale)
+            pow10 = _POW10.get(scale)
+            scaled_value = value * (pow10 if pow10 is not None else 10.0 ** scale)
+            attrs[key] = scaled_value
+            if debug:
+                self.logger.debug("\t%-40s - %s", key, round(scaled_value, max(0, -scale)))
+
+    def check_connection(self) -> bool:
+        """
+        Checks the connection to the inverter, opening it if needed.
+        :return: True if connected, False otherwise.
+        """
+        try:
+            self._ensure_connected()
+        except ConnectionError:
+            return False
+        return True
+
+    async def get_inverter_data(self):
+        """
+        Connects to the inverter, reads all registers, applies scaling factors,
+        and stores the scaled data in the class attributes.
+        """
         # Read all registers
         self.logger.info("Reading all registers from the inverter...")
-        registers = self.read_all()
+        registers = await self._run_io(self.read_all)
 
         # Set SunSpec registers
         self.logger.debug("Read SunSpec registers...")
-        for key in SUNSPEC_REGISTERS:
-            if key in registers:
-                if hasattr(self, key):
-                    setattr(self, key, registers[key])
-                    self.logger.debug(f"\t{key:<40s} - {registers[key]}")
-                else:
-                    self.logger.warning(f"Warning: Attribute {key} not found in class.")
+        writable = self._writable
+        attrs = self.__dict__
+        for key in _SUNSPEC_SET.intersection(registers):
+            if key in writable:
+                attrs[key] = registers[key]
+                self.logger.debug("\t%-40s - %s", key, registers[key])
+            else:
+                self.logger.warning("Warning: Attribute %s not found in class.", key)
 
         # Apply scaling factors and store the scaled data
-        self.logger.debug("Read scaling factors and setting registers...")
-        for key, scale_key in REGISTER_SCALE_FACTORS.items():
-            if key in registers and scale_key in registers:
-                scaled_value = round(
-                    float(registers[key]) * (10 ** int(registers[scale_key])),
-                    int(registers[scale_key]),
-                )
-
-            # Store the scaled value in the corresponding attribute
-            if hasattr(self, key):
-                setattr(self, key, scaled_value)
-                self.logger.debug(f"\t{key:<40s} - {registers[key]}")
-            else:
-                self.logger.warning(f"Warning: Attribute {key} not found in class.")
+        self._apply_scale_factors(registers)
 
         # Set Inverter Status registers
         self.logger.debug("Read Inverter Status registers...")
-        for key in INVERTER_STATUS_REGISTERS:
-            if key in registers:
-                if hasattr(self, key):
-                    key_type_conversion = self.registers[key][4]
-                    setattr(self, key, key_type_conversion(registers[key]))
-                    self.logger.debug(f"\t{key:<40s} - {registers[key]}")
-
-                else:
-                    self.logger.warning(f"Warning: Attribute {key} not found in class.")
-
-        # Disconnect after reading
-        await self.disconnect()
+        for key, key_type_conversion in self._status_converters.items():
+            value = registers.get(key)
+            if value is not None:
+                attrs[key] = key_type_conversion(value)
+                self.logger.debug("\t%-40s - %s", key, value)
 
     async def update_cashed_poll_inverter_registers(self):
         """
@@ -267,39 +367,16 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         # Read poll registers
         self.logger.info("Reading inverter poll registers from the inverter...")
 
-        # Initialize the connection
-        self.connect()
-
-        if not self.connected():
-            self.logger.error("Failed to connect to the inverter.")
-            raise ConnectionError("Failed to connect to the inverter.")
-
         read_registers = {}
-        for register in INVERTER_POLL_REGISTERS:
+        for block in self._poll_blocks:
             try:
-                read_registers.update(self.read(register))
+                read_registers.update(await self._run_io(self._read_block, block))
             except Exception as e:
-                self.logger.error(f"Error reading register {register}: {e}")
-                read_registers[register] = None
-
-        # Disconnect after reading
-        self.disconnect()
+                self.logger.error("Error reading registers %d-%d: %s", block[0], block[0] + block[1] - 1, e)
+                read_registers.update({entry[0]: None for entry in block[2]})
 
         # Apply scaling factors and store the scaled data
-        self.logger.debug("Read scaling factors and setting registers...")
-        for key, scale_key in REGISTER_SCALE_FACTORS.items():
-            if key in read_registers and scale_key in read_registers:
-                scaled_value = round(
-                    float(read_registers[key]) * (10 ** int(read_registers[scale_key])),
-                    int(read_registers[scale_key]),
-                )
-
-            # Store the scaled value in the corresponding attribute
-            if hasattr(self, key):
-                setattr(self, key, scaled_value)
-                self.logger.debug(f"\t{key:<40s} - {scaled_value}")
-            else:
-                self.logger.warning(f"Warning: Attribute {key} not found in class.")
+        self._apply_scale_factors(read_registers)
 
     async def update_cashed_control_inverter_registers(self):
         """
@@ -309,39 +386,16 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         # Read poll registers
         self.logger.info("Reading inverter poll registers from the inverter...")
 
-        # Initialize the connection
-        self.connect()
-
-        if not self.connected():
-            self.logger.error("Failed to connect to the inverter.")
-            raise ConnectionError("Failed to connect to the inverter.")
-
         read_registers = {}
         for register in INVERTER_CONTROL_REGISTERS:
             try:
-                read_registers.update(self.read(register))
+                read_registers.update(await self._run_io(self.read, register))
             except Exception as e:
-                self.logger.error(f"Error reading register {register}: {e}")
+                self.logger.error("Error reading register %s: %s", register, e)
                 read_registers[register] = None
 
-        # Disconnect after reading
-        self.disconnect()
-
         # Apply scaling factors and store the scaled data
-        self.logger.debug("Read scaling factors and setting registers...")
-        for key, scale_key in REGISTER_SCALE_FACTORS.items():
-            if key in read_registers and scale_key in read_registers:
-                scaled_value = round(
-                    float(read_registers[key]) * (10 ** int(read_registers[scale_key])),
-                    int(read_registers[scale_key]),
-                )
-
-            # Store the scaled value in the corresponding attribute
-            if hasattr(self, key):
-                setattr(self, key, scaled_value)
-                self.logger.debug(f"\t{key:<40s} - {scaled_value}")
-            else:
-                self.logger.warning(f"Warning: Attribute {key} not found in class.")
+        self._apply_scale_factors(read_registers)
 
     def get_cashed_inverter_registers_as_json(self):
         """
@@ -349,16 +403,7 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         """
         self.logger.info("Get inverter registers as json")
 
-        all_data = {}
-        for attribute in dir(self):
-            if (
-                attribute in SUNSPEC_REGISTERS + INVERTER_POLL_REGISTERS
-                and not callable(getattr(self, attribute))
-            ):
-                value = getattr(self, attribute)
-                all_data[attribute] = value
-
-        return all_data
+        return {attribute: getattr(self, attribute) for attribute in _ALL_JSON_ATTR_TUPLE}
 
     def get_cashed_data_as_json(self):
         """
@@ -366,15 +411,7 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         """
         self.logger.info("Get inverter poll registers as json")
 
-        poll_data = {}
-        for attribute in dir(self):
-            if attribute in INVERTER_POLL_REGISTERS and not callable(
-                getattr(self, attribute)
-            ):
-                value = getattr(self, attribute)
-                poll_data[attribute] = value
-
-        return poll_data
+        return {attribute: getattr(self, attribute) for attribute in _POLL_ATTR_TUPLE}
 
     def print_inverter_data(self):
         """
@@ -382,10 +419,8 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         """
 
         print("\nInverter Data: \n\tAttribute           : Value")
-        for attribute in dir(self):
-            if attribute.startswith("c_") and not callable(getattr(self, attribute)):
-                value = getattr(self, attribute)
-                print(f"\t{attribute:<20}: {value}")
+        for attribute in SUNSPEC_REGISTERS:
+            print(f"\t{attribute:<20}: {getattr(self, attribute)}")
         print("\n")
 
     def print_all(self):
@@ -395,15 +430,10 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         print(
             "\nInverter Registers and settings: \n\tRegister and settings                   : Value"
         )
-        for attribute in dir(self):
-            if (
-                not attribute.startswith("_")
-                and not callable(getattr(self, attribute))
-                and attribute
-                not in ["registers", "battery_dids", "client", "meter_dids", "logger"]
-            ):
-                value = getattr(self, attribute)
-                print(f"\t{attribute:<40}: {value}")
+        attrs = self.__dict__
+        for attribute in sorted(attrs):
+            if not attribute.startswith("_") and attribute not in _PRINT_EXCLUDE:
+                print(f"\t{attribute:<40}: {attrs[attribute]}")
         print("\n")
 
     async def set_production_limit(self, limit: int):
@@ -427,27 +457,17 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         """
 
         if not (0 <= limit <= 100):
-            self.logger.error(f"Limit must be between 0 and 100. Got: {limit}")
+            self.logger.error("Limit must be between 0 and 100. Got: %s", limit)
             raise ValueError("Limit must be between 0 and 100.")
 
-        # Initialize the connection
-        self.connect()
-
-        if not self.connected():
-            self.logger.error("Failed to connect to the inverter.")
-            raise ConnectionError("Failed to connect to the inverter.")
-
         # Set active power limit
-        self.logger.info(f"Setting active power limit to {limit}%")
-        self.write("active_power_limit", limit)
+        self.logger.info("Setting active power limit to %s%%", limit)
+        await self._run_io(self.write, "active_power_limit", limit)
 
         # Apply the setting
         # logger.info("Committing power control settings...")
         # self.write("commit_power_control_settings", 1)
 
-        # Disconnect after setting
-        self.disconnect()
-
     async def set_restore_power_control_defaults(self):
         """
         Restores the power control settings to their default values.
@@ -457,24 +477,14 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
                         1 = Commit
         """
 
-        # Initialize the connection
-        self.connect()
-
-        if not self.connected():
-            self.logger.error("Failed to connect to the inverter.")
-            raise ConnectionError("Failed to connect to the inverter.")
-
         # Restore defaults
         self.logger.info("Restoring power control default settings...")
-        self.write("restore_power_control_default_settings", 1)
+        await self._run_io(self.write, "restore_power_control_default_settings", 1)
 
         # Set active power limit
         self.logger.info("Revert setting active power limit to 100%")
-        self.write("active_power_limit", 100)
+        await self._run_io(self.write, "active_power_limit", 100)
 
         # Apply the setting
         # logger.info("Committing power control settings...")
         # self.write("commit_power_control_settings", 1)
-
-        # Disconnect after setting
-        self.disconnect()
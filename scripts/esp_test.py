@@ -1,25 +1,31 @@
 import asyncio, math, time
-from aioesphomeapi import (
-    APIClient, APIConnectionError,
-    SensorInfo, BinarySensorInfo, TextSensorInfo,
-)
 
 HOST = "192.168.30.182"
 PORT = 6053
 ENCRYPTION_KEY = "004Nt8RGUB3CMOGb9vnY3sCblsx8vYbZSwrSwE2UbOE="  # base64-encoded 32-byte key
-WINDOW_SECONDS = 0.5  # Reduced from 3 seconds
+WINDOW_SECONDS = 1.0  # Upper bound; returns as soon as every entity has reported
+CONNECT_TIMEOUT = 3.0  # Covers connect + entity discovery
 
 async def main():
     start_time = time.time()
-    
+
+    # Imported here so the module loads without pulling in protobuf/noise
+    from aioesphomeapi import (
+        APIClient, APIConnectionError,
+        SensorInfo, BinarySensorInfo, TextSensorInfo,
+    )
+
     client = APIClient(HOST, PORT, password="", noise_psk=ENCRYPTION_KEY)
     try:
-        await client.connect(login=True)
+        await asyncio.wait_for(client.connect(login=True), CONNECT_TIMEOUT)
 
         print(f"Time to connect: {time.time() - start_time:.2f} seconds")
         
         # discover entities
-        entities, _ = await client.list_entities_services()
+        entities, _ = await asyncio.wait_for(
+            client.list_entities_services(),
+            max(0.1, CONNECT_TIMEOUT - (time.time() - start_time)),
+        )
         meta = {}  # key -> (object_id, name, unit, kind)
         for ent in entities:
             if isinstance(ent, SensorInfo):
@@ -35,6 +41,7 @@ async def main():
 
         # collect first value seen per entity
         states = {}
+        all_reported = asyncio.Event()
         def on_state(msg):
             k = getattr(msg, "key", None)
             if k not in meta or k in states:
@@ -49,16 +56,21 @@ async def main():
                 states[k] = bool(msg.state)
             elif kind == "text_sensor" and hasattr(msg, "state") and msg.state is not None:
                 states[k] = msg.state
+            if len(states) >= len(meta):
+                all_reported.set()
 
         # subscribe (do NOT await; not a coroutine in many versions)
         client.subscribe_states(on_state)
 
         print(f"Time to discover entities: {time.time() - start_time:.2f} seconds")
         
-        # allow time for the device to push current states
-        await asyncio.sleep(WINDOW_SECONDS)
+        # wait for the device to push current states, at most WINDOW_SECONDS
+        try:
+            await asyncio.wait_for(all_reported.wait(), WINDOW_SECONDS)
+        except asyncio.TimeoutError:
+            pass
 
-        print(f"Time after sleep: {time.time() - start_time:.2f} seconds")
+        print(f"Time after waiting for states: {time.time() - start_time:.2f} seconds")
 
         # print snapshot
         print("Entities (sensor/binary_sensor/text_sensor):")
@@ -74,6 +86,8 @@ async def main():
 
     except APIConnectionError as e:
         print("Failed to connect:", e)
+    except asyncio.TimeoutError:
+        print(f"Timed out after {CONNECT_TIMEOUT}s connecting to {HOST}:{PORT}")
     finally:
         await client.disconnect()
         print(f"Total time: {time.time() - start_time:.2f} seconds")
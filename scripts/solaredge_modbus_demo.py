@@ -1,7 +1,48 @@
+import logging
 import time
 import random
+import struct
+from pymodbus.register_read_message import ReadHoldingRegistersResponse
 from src.SolarEdgeInverter import SolarEdgeInverter
 
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(name)s - %(funcName)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+POWER_CONTROL_REGISTERS = ("commit_power_control_settings", "active_power_limit")
+UINT16_NOT_IMPLEMENTED = 0xFFFF
+INT16_NOT_IMPLEMENTED = -0x8000  # 0x8000 as unpacked by the signed "h" code
+
+
+def read_power_control():
+    values = {}
+    for name in POWER_CONTROL_REGISTERS:
+        values.update(se_inverter.read(name))
+    return values
+
+
+def poll_power_control(limit, start, timeout=2.0, interval=0.05):
+    """Poll until the commit register changes (or timeout) and print every distinct state once."""
+    first = read_power_control()
+    states = [(time.time() - start, first)]
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        values = read_power_control()
+        if values != states[-1][1]:
+            states.append((time.time() - start, values))
+        if values["commit_power_control_settings"] != first["commit_power_control_settings"]:
+            break
+
+    lines = []
+    for elapsed, values in states:
+        lines.append(f" After setting production limit to {limit} % and {elapsed}s wait")
+        lines.extend(f"   Register {name}: {values[name]}" for name in POWER_CONTROL_REGISTERS)
+    print("\n".join(lines))
+
+
 se_inverter = SolarEdgeInverter(device="/dev/ttyUSB0", baud=9600, timeout=2)
 se_inverter.print_inverter_data()
 se_inverter.print_all()
@@ -14,19 +55,11 @@ print(f"\nSet active power limit to {limit}%")
 se_inverter.set_production_limit(limit)
 
 now = time.time()
-for i in range(8):
-    print(f" After setting production limit to {limit} % and {time.time() - now}s wait")
-    print(f"   Register commit_power_control_settings: {se_inverter.read('commit_power_control_settings')}")
-    print(f"   Register active_power_limit: {se_inverter.read('active_power_limit')}")
+poll_power_control(limit, now)
 
 print(f"\nSet active power limit to 100%")
 se_inverter.set_restore_power_control_defaults()
-
-limit = 100
-for i in range(8):
-    print(f" After setting production limit to {limit} % and {time.time()-now}s wait")
-    print(f"   Register commit_power_control_settings: {se_inverter.read('commit_power_control_settings')}")
-    print(f"   Register active_power_limit: {se_inverter.read('active_power_limit')}")
+poll_power_control(100, now)
 
 
 # Set limit multiple times
@@ -35,21 +68,12 @@ for i in range(4):
     limit = random.randint(10,90)
     print(f"\nSet active power limit to {limit}%")
     se_inverter.set_production_limit(limit)    
-    print(f" After setting production limit to {limit} % and {time.time()-now}s wait")
-    print(f"   Register commit_power_control_settings: {se_inverter.read('commit_power_control_settings')}")
-    print(f"   Register active_power_limit: {se_inverter.read('active_power_limit')}")
-    time.sleep(2)
+    poll_power_control(limit, now)
 
 
 print(f"\nSet active power limit to 100%")
 se_inverter.set_restore_power_control_defaults()
-print(f" After setting production limit to 100% -  {se_inverter.read('active_power_limit')}")
-time.sleep(1)
-print(f" After setting production limit to 100% -  {se_inverter.read('active_power_limit')}")
-print(f"   Register commit_power_control_settings: {se_inverter.read('commit_power_control_settings')}")
-print(f" After setting production limit to 100% -  {se_inverter.read('active_power_limit')}")
-time.sleep(8)
-print(f" 8 - After setting production limit to 100% -  {se_inverter.read('active_power_limit')}")
+poll_power_control(100, now, timeout=8)
 
 
 
@@ -60,13 +84,28 @@ se_inverter.print_all()
 
 total_time = 0
 currents = ["current", "l1_current", "l2_current", "l3_current","l1_voltage", "l2_voltage", "l3_voltage", "l1n_voltage", "l2n_voltage", "l3n_voltage"]
+
+# current (40071) .. voltage_scale (40082) are contiguous in the SunSpec inverter model,
+# so one request returns all currents, voltages and both scale factors
+block_start = se_inverter.registers["current"][0]
+block_len = se_inverter.registers["voltage_scale"][0] + 1 - block_start
 for i in range(1):
     now = time.time()
-    a = []
-    for register in currents:
-        a.append(se_inverter.read(register))
-    
+    result = se_inverter.client.read_holding_registers(block_start, block_len, slave=se_inverter.unit)
+    if not isinstance(result, ReadHoldingRegistersResponse) or len(result.registers) != block_len:
+        raise IOError(f"Invalid response for {block_len} registers at {block_start}: {result}")
+    words = struct.unpack(">4Hh6Hh", struct.pack(f">{block_len}H", *result.registers))
+
+    # SunSpec "not implemented" sentinels (uint16 0xFFFF, int16 0x8000) read as None, not as values
+    currents_raw = [None if w == UINT16_NOT_IMPLEMENTED else w for w in words[0:4]]
+    voltages_raw = [None if w == UINT16_NOT_IMPLEMENTED else w for w in words[5:11]]
+    current_exp = None if words[4] == INT16_NOT_IMPLEMENTED else words[4]
+    voltage_exp = None if words[11] == INT16_NOT_IMPLEMENTED else words[11]
+
+    a = [None if w is None or current_exp is None else w * 10 ** current_exp for w in currents_raw]
+    a += [None if w is None or voltage_exp is None else w * 10 ** voltage_exp for w in voltages_raw]
+
     cycle =  time.time()-now
     total_time += cycle
-    
-    print(a,cycle, cycle/len(currents), total_time)
+
+    print(dict(zip(currents, a)), cycle, cycle/len(currents), total_time)
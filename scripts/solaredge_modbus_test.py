@@ -1,6 +1,5 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from collections import deque
 
 # ---------------- CONFIG ----------------
 PEAK_PRODUCTION_W = 10500        # Inverter max power (100%)
@@ -21,44 +20,44 @@ solar_production = np.clip(solar_production, 0, PEAK_PRODUCTION_W)
 np.random.seed(42)
 house_consumption = np.random.randint(200, 8000, size=SAMPLES)
 
-# Cyclic buffer for smoothing export
-export_buffer = deque(maxlen=BUFFER_SIZE)
-smoothed_export_list = []
-limit_factor_list = []
 
-last_percent = 100  # start at 100%
+def rate_limit(desired, start_percent, max_delta, min_percent, max_percent=100):
+    """
+    Apply the per-step rate limit and clamp to a series of desired percents.
 
-for i in range(SAMPLES):
-    # Calculate grid export
-    momentary_export = solar_production[i] - house_consumption[i]
-    
-    # Apply cyclic buffer moving average
-    export_buffer.append(momentary_export)
-    smoothed_export = sum(export_buffer)/len(export_buffer)
-    smoothed_export_list.append(smoothed_export)
-    
-    # Compute limit factor
-    if LIMIT_EXPORT:
-        # Compute minimum production percent
-        min_percent = (MIN_PRODUCTION_W / PEAK_PRODUCTION_W) * 100
-        # Desired percent to limit export
-        desired_percent = max(
-            min_percent,
-            100 - ((smoothed_export - MAX_EXPORT_W)/PEAK_PRODUCTION_W*100)
-        )
-        # Rate limit
-        delta = desired_percent - last_percent
-        if delta > MAX_DELTA_PERCENT:
-            desired_percent = last_percent + MAX_DELTA_PERCENT
-        elif delta < -MAX_DELTA_PERCENT:
-            desired_percent = last_percent - MAX_DELTA_PERCENT
-        # Clamp
-        desired_percent = max(min_percent, min(100, desired_percent))
-        last_percent = desired_percent
-    else:
-        desired_percent = 100
-        
-    limit_factor_list.append(desired_percent)
+    Each step depends on the previous output, so this stays a scalar loop.
+    """
+    limited = np.empty_like(desired)
+    last_percent = start_percent
+    for i, percent in enumerate(desired):
+        percent = min(max(percent, last_percent - max_delta), last_percent + max_delta)
+        last_percent = min(max(percent, min_percent), max_percent)
+        limited[i] = last_percent
+    return limited
+
+
+# Calculate grid export
+momentary_export = solar_production - house_consumption
+
+# Moving average over the last BUFFER_SIZE samples (shorter window while filling up),
+# from a running sum: add the newest sample, subtract the one leaving the window
+running_sum = np.cumsum(momentary_export)
+window_sum = running_sum.copy()
+window_sum[BUFFER_SIZE:] -= running_sum[:-BUFFER_SIZE]
+smoothed_export_list = window_sum / np.minimum(np.arange(1, SAMPLES + 1), BUFFER_SIZE)
+
+# Compute limit factor
+if LIMIT_EXPORT:
+    # Compute minimum production percent
+    min_percent = (MIN_PRODUCTION_W / PEAK_PRODUCTION_W) * 100
+    # Desired percent to limit export
+    desired_percent = np.maximum(
+        min_percent,
+        100 - ((smoothed_export_list - MAX_EXPORT_W) / PEAK_PRODUCTION_W * 100)
+    )
+    limit_factor_list = rate_limit(desired_percent, 100, MAX_DELTA_PERCENT, min_percent)
+else:
+    limit_factor_list = np.full(SAMPLES, 100.0)
 
 # Compute limited production (for visualization)
 limited_production = np.array(solar_production) * np.array(limit_factor_list)/100
@@ -3,4 +3,5 @@ from typing import Protocol
 class BaseSensor(Protocol):
     async def ensure_connected(self) -> None: ...
     async def disconnect(self) -> None: ...
+    async def read_control_data(self) -> dict: ...
     def get_data_as_json(self) -> dict: ...
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-import confuse
 import logging
+import os
 
 @dataclass
 class ESPSensorConfig:
@@ -22,26 +22,76 @@ class AppConfig:
     api_token: str
     debug_level: str
 
+# Configs already loaded by this process, keyed by path -> (mtime_ns, size)
+_loaded: dict[str, tuple[tuple[int, int], AppConfig]] = {}
+# Level the root logger was last configured with
+_logging_level: str | None = None
+
+
 def load_config(config_file: str = "config.yaml") -> AppConfig:
-    cfg = confuse.Configuration("solar_controller", __name__)
-    cfg.set_file(config_file)
+    """
+    Load the application config and configure logging.
+
+    Repeat calls in the same process return the previous result while the
+    file's mtime and size are unchanged.
+    """
+    try:
+        st = os.stat(config_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    loaded = _loaded.get(config_file)
+    if stamp is not None and loaded is not None and loaded[0] == stamp:
+        return loaded[1]
+
+    app_config = _parse_config(config_file)
+    if stamp is not None:
+        _loaded[config_file] = (stamp, app_config)
+    _configure_logging(app_config.debug_level)
+    return app_config
+
+
+def _parse_config(config_file: str) -> AppConfig:
+    # Only needed when the file is (re)parsed, so keep PyYAML out of the startup imports
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_file, "rb") as f:
+        raw = yaml.load(f, Loader=loader)
+
+    esp = raw["ESP_SENSOR"]
+    inv = raw["INVERTER"]
 
-    # Load sections
     esp_sensor = ESPSensorConfig(
-        reader_host=cfg["ESP_SENSOR"]["ESP_READER_HOST"].get(str),
-        reader_port=cfg["ESP_SENSOR"]["ESP_READER_PORT"].get(int),
-        encryption_key=cfg["ESP_SENSOR"]["ESP_READER_ENCRYPTION_KEY"].get(str),
-        window_seconds=cfg["ESP_SENSOR"]["ESP_READER_WINDOW_SECONDS"].get(float),
+        reader_host=str(esp["ESP_READER_HOST"]),
+        reader_port=int(esp["ESP_READER_PORT"]),
+        encryption_key=str(esp["ESP_READER_ENCRYPTION_KEY"]),
+        window_seconds=float(esp["ESP_READER_WINDOW_SECONDS"]),
     )
 
     inverter = InverterConfig(
-        device=cfg["INVERTER"]["SOLAR_EDGE_INVERTER_DEVICE"].get(str),
-        baud=cfg["INVERTER"]["SOLAR_EDGE_INVERTER_BAUD"].get(int),
-        timeout=cfg["INVERTER"]["SOLAR_EDGE_INVERTER_TIMEOUT"].get(int),
+        device=str(inv["SOLAR_EDGE_INVERTER_DEVICE"]),
+        baud=int(inv["SOLAR_EDGE_INVERTER_BAUD"]),
+        timeout=int(inv["SOLAR_EDGE_INVERTER_TIMEOUT"]),
     )
 
-    api_token = cfg["API"]["TOKEN"].get(str)
-    debug_level = cfg["DEBUG_LEVEL"].get(str)
+    api_token = str(raw["API"]["TOKEN"])
+    debug_level = str(raw["DEBUG_LEVEL"])
+
+    return AppConfig(
+        esp_sensor=esp_sensor,
+        inverter=inverter,
+        api_token=api_token,
+        debug_level=debug_level,
+    )
+
+
+def _configure_logging(debug_level: str) -> None:
+    global _logging_level
+    if debug_level == _logging_level:
+        return
+    _logging_level = debug_level
 
     # --- Configure logging here ---
     log_level = getattr(logging, debug_level.upper(), logging.INFO)
@@ -57,16 +107,14 @@ def load_config(config_file: str = "config.yaml") -> AppConfig:
         handler.setFormatter(formatter)
         root_logger.addHandler(handler)
 
+        # Our format uses no thread/process fields, so skip collecting them per record
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
     # Optional: reduce noisy libraries
     logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
     logging.getLogger("pymodbus").setLevel(logging.WARNING)
     logging.getLogger("aioesphomeapi.connection").setLevel(logging.WARNING)
 
-    logging.info(f"Logger configured with level {debug_level.upper()}")
-
-    return AppConfig(
-        esp_sensor=esp_sensor,
-        inverter=inverter,
-        api_token=api_token,
-        debug_level=debug_level,
-    )
+    logging.info("Logger configured with level %s", debug_level.upper())
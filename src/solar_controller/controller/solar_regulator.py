@@ -1,6 +1,44 @@
 import logging
 from typing import Optional
 
+log = logging.getLogger(__name__)
+
+
+def compute_limited_power(
+    last_limited_power: float,
+    home: float,
+    solar: float,
+    max_step_watt: float,
+    max_export_w: float,
+    min_production_w: float,
+    gain: float,
+) -> tuple[float, int]:
+    """
+    One regulation step on plain floats, without any object state.
+
+    Returns the new limited inverter power [W] and the matching integer
+    scale factor (0–100 %). `solar` must be positive.
+    """
+    # Target inverter output to meet export constraint
+    desired_power = home + max_export_w
+
+    # Proportional step (gentle for small errors), hard ramp limit (safety)
+    step = (desired_power - last_limited_power) * gain
+    step = -max_step_watt if step < -max_step_watt else (max_step_watt if step > max_step_watt else step)
+
+    # Apply step within physical constraints
+    limited_power = last_limited_power + step
+    if limited_power < min_production_w:
+        limited_power = min_production_w
+    if limited_power > solar:
+        limited_power = solar
+
+    # Convert to integer scale factor (limited_power is positive, so +0.5 and truncation rounds)
+    scale_factor = int(limited_power * 100.0 / solar + 0.5)
+    scale_factor = 0 if scale_factor < 0 else (100 if scale_factor > 100 else scale_factor)
+
+    return limited_power, scale_factor
+
 
 class SolarRegulator:
     """
@@ -40,6 +78,11 @@ class SolarRegulator:
         self.last_limited_power: Optional[float] = None
         self.current_price: float = 0.0
         self.negative_price: bool = False
+        # Inputs and result of the previous cycle; reused while the state is at a fixed point
+        self._last_inputs: Optional[tuple[float, float, float, bool]] = None
+        self._last_scale_factor: int = 100
+        # last_limited_power when the previous cycle left it unchanged, else None
+        self._fixed_point: Optional[float] = None
 
         # Precomputed maximum power change per control cycle [W]
         self.max_step_watt: float = (
@@ -82,52 +125,54 @@ class SolarRegulator:
         solar: float = max(0.0, float(current_solar_production))
         new_price: float = float(updated_current_price)
         new_negative_price: bool = bool(updated_negative_price)
-        
+
+        # Same inputs and unchanged state last cycle -> the result cannot change either
+        inputs = (home, solar, new_price, new_negative_price)
+        if (
+            self._fixed_point is not None
+            and self.last_limited_power == self._fixed_point
+            and inputs == self._last_inputs
+        ):
+            return self._last_scale_factor
+        self._last_inputs = inputs
+
         if new_price != self.current_price or new_negative_price != self.negative_price:
             self.current_price = new_price
             self.negative_price = new_negative_price
-            logging.info(f"Updated price info: current_price={self.current_price}, negative_price={self.negative_price}")
+            log.info("Updated price info: current_price=%s, negative_price=%s", new_price, new_negative_price)
 
         # Initialize internal state on first call
-        if self.last_limited_power is None:
-            self.last_limited_power = solar
+        last_limited_power = self.last_limited_power
+        if last_limited_power is None:
+            last_limited_power = solar
 
         # Night or very low PV → no regulation
         if solar < self.LOW_PV_THRESHOLD:
+            self._fixed_point = solar if self.last_limited_power == solar else None
             self.last_limited_power = solar
+            self._last_scale_factor = 100
             return 100
 
-        # Target inverter output to meet export constraint
-        desired_power: float = home + self.MAX_EXPORT_W
-
-        # Control error (watts)
-        error: float = desired_power - self.last_limited_power
-
-        # Proportional step (gentle for small errors)
-        step: float = error * self.GAIN_SMALL_ERROR
-
-        # Hard ramp limit (safety)
-        step = max(-self.max_step_watt, min(self.max_step_watt, step))
-
-        # Apply step
-        limited_power: float = self.last_limited_power + step
-
-        # Physical constraints
-        limited_power = max(limited_power, self.MIN_PRODUCTION_W)
-        limited_power = min(limited_power, solar)
+        limited_power, scale_factor = compute_limited_power(
+            last_limited_power,
+            home,
+            solar,
+            self.max_step_watt,
+            self.MAX_EXPORT_W,
+            self.MIN_PRODUCTION_W,
+            self.GAIN_SMALL_ERROR,
+        )
 
         # Update state
+        self._fixed_point = limited_power if limited_power == last_limited_power else None
         self.last_limited_power = limited_power
 
-        # Convert to integer scale factor
-        scale_factor: int = int(round(100.0 * limited_power / solar))
-        scale_factor = max(0, min(100, scale_factor))
-
         # Check if price is negative - if so, set scale factor to 100%
-        if self.negative_price:
+        if new_negative_price:
             scale_factor = 100
-            logging.debug("Negative price detected, setting scale factor to 100%")
-        else:
-            logging.debug(f"Computed scale factor: {scale_factor}% for limited power: {limited_power} W")        
+            log.debug("Negative price detected, setting scale factor to 100%")
+        elif log.isEnabledFor(logging.DEBUG):
+            log.debug("Computed scale factor: %s%% for limited power: %s W", scale_factor, limited_power)
 
+        self._last_scale_factor = scale_factor
         return scale_factor
@@ -1,11 +1,18 @@
-from solar_controller.inverter.solaredge_inverter import SolarEdgeInverter
+from typing import TYPE_CHECKING
+
 from solar_controller.config import InverterConfig
 
+if TYPE_CHECKING:
+    from solar_controller.inverter.solaredge_inverter import SolarEdgeInverter
+
 
-def create_inverter(config: InverterConfig) -> SolarEdgeInverter:
+def create_inverter(config: InverterConfig) -> "SolarEdgeInverter":
     """
     Instantiate the configured inverter.
     """
+    # Deferred so importing the factory does not pull in solaredge_modbus/pymodbus
+    from solar_controller.inverter.solaredge_inverter import SolarEdgeInverter
+
     return SolarEdgeInverter(
         device=config.device,
         baud=config.baud,
@@ -1,9 +1,16 @@
-from solar_controller.sensors.esphome_reader import ESPHomeReader
+from typing import TYPE_CHECKING
+
 from solar_controller.config import ESPSensorConfig
 
+if TYPE_CHECKING:
+    from solar_controller.sensors.esphome_reader import ESPHomeReader
+
 
-def create_sensor(config: ESPSensorConfig) -> ESPHomeReader:
+def create_sensor(config: ESPSensorConfig) -> "ESPHomeReader":
     """Instantiate the configured ESPHome sensor."""
+    # Deferred so importing the factory does not pull in aioesphomeapi
+    from solar_controller.sensors.esphome_reader import ESPHomeReader
+
     return ESPHomeReader(
         host=config.reader_host,
         port=config.reader_port,
@@ -1,10 +1,238 @@
+import array
 import asyncio
 import logging
+import socket
+import struct
+import sys
 import time
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, Sequence
 
+import orjson
 import solaredge_modbus
-from .solaredge_inverter_registers import REGISTERS, PollGroup
+from solaredge_modbus import SUNSPEC_NOTIMPLEMENTED, registerDataType
+from pymodbus.register_read_message import ReadHoldingRegistersResponse
+
+from .solaredge_inverter_registers import (
+    HA_REGISTERS,
+    HA_REGISTERS_BY_GROUP,
+    REGISTER_NAMES,
+    REGISTER_NAMES_BY_GROUP,
+    REGISTERS,
+    SCALE_OF,
+    PollGroup,
+)
+
+# Modbus limits a single holding-register read to 125 words
+MAX_BLOCK_WORDS = 125
+# Largest hole (in words) between two registers that is still read as one block
+MAX_BLOCK_GAP = 8
+
+# REGISTERS-derived lookups, built once per process
+_ALL_KEYS: list[str] = list(REGISTERS.keys())
+# Initial (unread) register values; each instance starts from a copy
+_REGISTER_NONES: Dict[str, Any] = dict.fromkeys(_ALL_KEYS)
+
+# Powers of ten for SunSpec scale factors, indexed by exponent + _POW10_OFFSET
+_POW10_OFFSET = 15
+_POW10 = tuple(10.0 ** e for e in range(-_POW10_OFFSET, _POW10_OFFSET + 1))
+
+
+# -----------------------------------
+# Word decoding
+# -----------------------------------
+# struct codes for the fixed-width data types (big-endian byte and word order)
+_STRUCT_CODES: Dict[registerDataType, str] = {
+    registerDataType.UINT16: "H",
+    registerDataType.INT16: "h",
+    registerDataType.UINT32: "I",
+    registerDataType.ACC32: "I",
+    registerDataType.INT32: "i",
+    registerDataType.UINT64: "Q",
+    registerDataType.FLOAT32: "f",
+    registerDataType.SEFLOAT: "f",
+}
+_LITTLE_ENDIAN_HOST = sys.byteorder == "little"
+
+
+def _clean_string(raw: bytes) -> str:
+    return raw.decode(encoding="utf-8", errors="ignore").replace("\x00", "").rstrip()
+
+
+def make_decoder(offset: int, length: int, dtype: registerDataType, vtype: Any) -> Callable[[Any, int], Any]:
+    """
+    Build a decoder for one register at a fixed word offset (big-endian byte and word order).
+
+    The data type is resolved once here, so the returned ``decode(words, base)``
+    only reads the words at ``base + offset`` and applies the SunSpec
+    "not implemented" sentinel check, mirroring solaredge_modbus' decoder.
+    """
+    if dtype == registerDataType.UINT16:
+        def read(words: Any, i: int) -> Any:
+            return words[i]
+    elif dtype == registerDataType.INT16:
+        def read(words: Any, i: int) -> Any:
+            word = words[i]
+            return word - 0x10000 if word & 0x8000 else word
+    elif dtype in (registerDataType.UINT32, registerDataType.ACC32):
+        def read(words: Any, i: int) -> Any:
+            return (words[i] << 16) | words[i + 1]
+    elif dtype == registerDataType.INT32:
+        def read(words: Any, i: int) -> Any:
+            value = (words[i] << 16) | words[i + 1]
+            return value - 0x100000000 if value & 0x80000000 else value
+    elif dtype == registerDataType.UINT64:
+        def read(words: Any, i: int) -> Any:
+            return (words[i] << 48) | (words[i + 1] << 32) | (words[i + 2] << 16) | words[i + 3]
+    elif dtype in (registerDataType.FLOAT32, registerDataType.SEFLOAT):
+        pack, unpack = struct.Struct(">HH").pack, struct.Struct(">f").unpack
+
+        def read(words: Any, i: int) -> Any:
+            return unpack(pack(words[i], words[i + 1]))[0]
+    elif dtype == registerDataType.STRING:
+        pack = struct.Struct(f">{length}H").pack
+
+        def read(words: Any, i: int) -> Any:
+            return _clean_string(pack(*words[i:i + length]))
+    else:
+        raise NotImplementedError(dtype)
+
+    sentinel = SUNSPEC_NOTIMPLEMENTED[dtype.name]
+
+    def decode(words: Any, base: int) -> Any:
+        value = read(words, base + offset)
+        if value == sentinel or value != value:
+            return vtype(False)
+        return vtype(value)
+
+    return decode
+
+
+def decode_words(words: Any, offset: int, length: int, dtype: registerDataType, vtype: Any) -> Any:
+    """Decode one register from a buffer of 16-bit words (big-endian byte and word order)."""
+    return make_decoder(0, length, dtype, vtype)(words, offset)
+
+
+# -----------------------------------
+# Block read layout
+# -----------------------------------
+@dataclass(frozen=True)
+class BlockEntry:
+    name: str
+    offset: int
+    length: int
+    decode: Callable[[Any, int], Any]
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    """
+    One contiguous holding-register read.
+
+    ``layout`` unpacks the whole block in a single struct call, with ``fields``
+    holding (name, sentinel, vtype, is_string) for each unpacked value. It is
+    None when registers overlap, in which case the per-entry decoders are used.
+    """
+    start: int
+    count: int
+    entries: tuple[BlockEntry, ...]
+    layout: Optional[struct.Struct] = None
+    fields: tuple[tuple[str, Any, Any, bool], ...] = ()
+
+    def decode(self, words: Sequence[int], base: int) -> Dict[str, Any]:
+        """Decode every register of the block from ``words[base:base + count]``."""
+        if self.layout is None:
+            return {e.name: e.decode(words, base) for e in self.entries}
+
+        chunk = array.array("H", words[base:base + self.count])
+        if _LITTLE_ENDIAN_HOST:
+            chunk.byteswap()
+        data: Dict[str, Any] = {}
+        for (name, sentinel, vtype, is_string), value in zip(self.fields, self.layout.unpack_from(chunk)):
+            if is_string:
+                value = _clean_string(value)
+            data[name] = vtype(False) if value == sentinel or value != value else vtype(value)
+        return data
+
+
+def _block_layout(
+    register_map: Dict[str, tuple], members: list[tuple[int, int, str]], start: int
+) -> tuple[Optional[struct.Struct], tuple[tuple[str, Any, Any, bool], ...]]:
+    """Build the single-call struct layout for a block, or (None, ()) if registers overlap."""
+    fmt = [">"]
+    fields = []
+    pos = start
+    for address, length, name in members:
+        if address < pos:
+            return None, ()
+        if address > pos:
+            fmt.append(f"{2 * (address - pos)}x")
+        dtype, vtype = register_map[name][3], register_map[name][4]
+        if dtype == registerDataType.STRING:
+            fmt.append(f"{2 * length}s")
+        else:
+            code = _STRUCT_CODES[dtype]
+            fmt.append(code)
+            # Registers declared longer than their type (e.g. a 2-word UINT16) are padded so later fields stay aligned
+            pad = 2 * length - struct.calcsize(code)
+            if pad > 0:
+                fmt.append(f"{pad}x")
+        fields.append((name, SUNSPEC_NOTIMPLEMENTED[dtype.name], vtype, dtype == registerDataType.STRING))
+        pos = address + length
+    return struct.Struct("".join(fmt)), tuple(fields)
+
+
+def plan_read_blocks(
+    register_map: Dict[str, tuple],
+    names: Iterable[str],
+    max_gap: int = MAX_BLOCK_GAP,
+    max_words: int = MAX_BLOCK_WORDS,
+) -> list[ReadBlock]:
+    """
+    Group registers into as few contiguous holding-register reads as possible.
+
+    :param register_map: solaredge_modbus register table (name -> (address, length, rtype, dtype, vtype, ...))
+    :param names: register names to include
+    :param max_gap: maximum number of unused words allowed between two registers in one block
+    :param max_words: maximum block size in words
+    :return: list of ReadBlock sorted by start address
+    """
+    layout = sorted(
+        (register_map[name][0], register_map[name][1], name) for name in names
+    )
+
+    blocks: list[ReadBlock] = []
+    start: Optional[int] = None
+    end = 0
+    members: list[tuple[int, int, str]] = []
+
+    def flush() -> None:
+        if start is None:
+            return
+        entries = tuple(
+            BlockEntry(
+                name,
+                address - start,
+                length,
+                make_decoder(address - start, length, register_map[name][3], register_map[name][4]),
+            )
+            for address, length, name in members
+        )
+        blocks.append(ReadBlock(start, end - start, entries, *_block_layout(register_map, members, start)))
+
+    for address, length, name in layout:
+        if start is not None and address - end <= max_gap and address + length - start <= max_words:
+            members.append((address, length, name))
+            end = max(end, address + length)
+            continue
+
+        flush()
+        start, end, members = address, address + length, [(address, length, name)]
+
+    flush()
+    return blocks
 
 
 class SolarEdgeInverter(solaredge_modbus.Inverter):
@@ -13,12 +241,16 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
     Blocks on Modbus I/O in a thread executor so async code can run without blocking the event loop.
 
     Provides:
-    - Async connection check
+    - Persistent Modbus connection, serialized by an asyncio lock
+    - Async session open at startup
     - Async register reads (all / poll / control / status)
     - Async writes for control registers
     - Register scaling and caching
     """
 
+    # Block plans depend only on the library's static register map; planned once per process
+    _block_plans: Optional[tuple[list[ReadBlock], Dict[PollGroup, list[ReadBlock]]]] = None
+
     def __init__(
         self, device: str = "/dev/ttyUSB0", baud: int = 9600, timeout: int = 2
     ) -> None:
@@ -29,48 +261,130 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         :param baud: serial baud rate
         :param timeout: Modbus timeout (s)
         """
+        # Scaled register values, all None until the first read
+        self._values: Dict[str, Any] = _REGISTER_NONES.copy()
+        # Encoded JSON per (output, group), valid until register values change
+        self._json_cache: Dict[tuple[str, Optional[PollGroup]], bytes] = {}
+
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("Initializing SolarEdgeInverter...")
 
         super().__init__(device=device, baud=baud, timeout=timeout)
 
-        # Initialize all register attributes to None
-        for reg in REGISTERS.keys():
-            setattr(self, reg, None)
-
         # Last successful update timestamp
         self.last_updated: float = 0
 
+        # Persistent connection state; the lock keeps Modbus frames from interleaving
+        self._connected = False
+        self._io_lock = asyncio.Lock()
+
+        # Calls are serialized by _io_lock, so a single dedicated thread keeps all Modbus I/O
+        # on one thread and off the shared default executor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modbus")
+
+        # HA sensor metadata per group, keyed to the serial number it was built for
+        self._ha_templates: Dict[Optional[PollGroup], Dict[str, dict]] = {}
+        self._ha_serial: Optional[str] = None
+
+        # Precomputed block reads for all registers and per poll group
+        cls = type(self)
+        if cls._block_plans is None:
+            cls._block_plans = (
+                plan_read_blocks(self.registers, _ALL_KEYS),
+                {group: plan_read_blocks(self.registers, names) for group, names in REGISTER_NAMES_BY_GROUP.items()},
+            )
+        self._all_blocks, self._group_blocks = cls._block_plans
+
+    # Register values keep attribute access (inverter.power_ac) but live in self._values
+    def __getattr__(self, name: str) -> Any:
+        values = self.__dict__.get("_values")
+        if values is not None and name in values:
+            return values[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in REGISTER_NAMES:
+            # Same copy-and-swap as _apply_registers, so published snapshots never change
+            values = dict(self._values)
+            values[name] = value
+            self._values = values
+            self._json_cache = {}
+        else:
+            super().__setattr__(name, value)
+
     # -------------------------
-    # Async Connection Helpers
+    # Connection Session
     # -------------------------
-    async def check_connection(self) -> bool:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._sync_check_connection)
+    def connect(self) -> bool:
+        """
+        Connect to the inverter.
 
-    def _sync_check_connection(self) -> bool:
-        self.connect()
+        Over Modbus TCP, Nagle's algorithm is disabled so small sequential
+        requests are not delayed waiting for ACKs. No-op for RTU.
+        """
+        connected = super().connect()
+        sock = getattr(self.client, "socket", None)
+        if connected and self.mode is solaredge_modbus.connectionType.TCP and sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connected
+
+    @contextmanager
+    def _session(self) -> Iterator[None]:
+        """
+        Reuse the open Modbus connection, connecting lazily on first use.
+
+        The connection is only torn down on error (so the next call reconnects)
+        or by `close()` on shutdown.
+        """
+        if not self._connected:
+            self.connect()
+            if not self.connected():
+                raise ConnectionError("Failed to connect to inverter")
+            self._connected = True
         try:
-            return self.connected()
-        finally:
-            self.disconnect()
+            yield
+        except Exception:
+            self._drop_connection()
+            raise
+
+    def _drop_connection(self) -> None:
+        self._connected = False
+        self.disconnect()
+
+    async def _run_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking Modbus call on the I/O executor, one call at a time."""
+        async with self._io_lock:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def close(self) -> None:
+        """Close the persistent Modbus connection and release the I/O thread pool."""
+        await self._run_io(self._drop_connection)
+        self._executor.shutdown(wait=False)
+
+    # -------------------------
+    # Async Connection Helpers
+    # -------------------------
+    async def open(self) -> None:
+        """Open the persistent Modbus session; raises ConnectionError if the inverter is unreachable."""
+        await self._run_io(self._sync_open)
+
+    def _sync_open(self) -> None:
+        with self._session():
+            pass
 
     # -------------------------
     # Async Register Reads
     # -------------------------
     async def read_all_registers(self) -> None:
         self.logger.info("Reading all registers from inverter...")
-        loop = asyncio.get_running_loop()
-        raw = await loop.run_in_executor(None, self._sync_read_all_registers)
-        self._apply_registers(raw, list(REGISTERS.keys()))
-        self.last_updated = time.time()
+        raw = await self._run_io(self._sync_read_all_registers)
+        self._apply_registers(raw, _ALL_KEYS)
+        # Registers of failed blocks keep their previous values; only a read that returned data is fresh
+        if raw:
+            self.last_updated = time.time()
 
     def _sync_read_all_registers(self) -> Dict[str, Any]:
-        self.connect()
-        try:
-            return self.read_all()
-        finally:
-            self.disconnect()
+        return self._sync_read_blocks(self._all_blocks)
 
     async def update_poll_registers(self) -> None:
         await self._async_update_group(PollGroup.POLL)
@@ -82,61 +396,112 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         await self._async_update_group(PollGroup.STATUS)
 
     async def _async_update_group(self, group: PollGroup) -> None:
-        loop = asyncio.get_running_loop()
-        raw = await loop.run_in_executor(None, self._sync_update_register_group, group)
-        regs = [r for r, v in REGISTERS.items() if v.group == group]
-        self._apply_registers(raw, regs)
-        self.last_updated = time.time()
+        raw = await self._run_io(self._sync_update_register_group, group)
+        self._apply_registers(raw, REGISTER_NAMES_BY_GROUP[group])
+        if raw:
+            self.last_updated = time.time()
 
     def _sync_update_register_group(self, group: PollGroup) -> Dict[str, Any]:
-        data: Dict[str, Any] = {}
-        self.connect()
-        try:
-            if not self.connected():
-                raise ConnectionError("Failed to connect to inverter")
+        return self._sync_read_blocks(self._group_blocks[group])
 
-            for name, reg in REGISTERS.items():
-                if reg.group == group:
+    def _sync_read_blocks(self, blocks: list[ReadBlock]) -> Dict[str, Any]:
+        """
+        Read and decode every block, retrying each up to ``self.retries`` times.
+
+        Registers of a block that still fails are left out of the result, so
+        ``_apply_registers`` keeps their previous values.
+        """
+        data: Dict[str, Any] = {}
+        failed = False
+        attempts = max(1, self.retries)
+        with self._session():
+            for block in blocks:
+                for attempt in range(1, attempts + 1):
                     try:
-                        data.update(self.read(name))
+                        data.update(self._read_block(block))
+                        break
                     except Exception as exc:
-                        self.logger.error("Error reading register %s: %s", name, exc)
-                        data[name] = None
-            return data
-        finally:
-            self.disconnect()
+                        if attempt == attempts:
+                            self.logger.error(
+                                "Error reading registers %d-%d after %d attempts: %s",
+                                block.start, block.start + block.count - 1, attempts, exc,
+                            )
+                            failed = True
+
+        # Force a reconnect on the next cycle if the link misbehaved
+        if failed:
+            self._drop_connection()
+        return data
+
+    def _read_block(self, block: ReadBlock) -> Dict[str, Any]:
+        """Read one contiguous register block and decode every register in it."""
+        result = self.client.read_holding_registers(block.start, block.count, slave=self.unit)
+        if not isinstance(result, ReadHoldingRegistersResponse) or len(result.registers) != block.count:
+            raise IOError(f"Invalid response for {block.count} registers at {block.start}: {result}")
+
+        return block.decode(result.registers, 0)
 
     # -------------------------
     # Scaling & Assignment
     # -------------------------
-    def _apply_registers(self, raw_registers: Dict[str, Any], keys: list[str]) -> None:
+    def _apply_registers(self, raw_registers: Dict[str, Any], keys: Iterable[str]) -> None:
+        # Copy-on-write: readers holding the previous dict keep a consistent view,
+        # and the new one is published with a single reference swap
+        values = dict(self._values)
+        scale_of = SCALE_OF.get
         for key in keys:
             if key not in raw_registers:
                 continue
 
             value = raw_registers[key]
-            scale_key = REGISTERS[key].scale
-
-            if (
-                value is not None
-                and scale_key
-                and scale_key in raw_registers
-                and raw_registers[scale_key] is not None
-            ):
+            scale_key = scale_of(key)
+            if scale_key is None:
+                exponent = None
+            elif scale_key in raw_registers:
+                exponent = raw_registers[scale_key]
+            else:
+                # Scale's block failed this read: keep using the last exponent that was read
+                exponent = values.get(scale_key)
+
+            if value is not None and exponent is not None:
                 try:
-                    value = float(value) * (10 ** int(raw_registers[scale_key]))
+                    exponent = int(exponent)
+                    if -_POW10_OFFSET <= exponent <= _POW10_OFFSET:
+                        value = float(value) * _POW10[exponent + _POW10_OFFSET]
+                    else:
+                        value = float(value) * (10.0 ** exponent)
                 except Exception as exc:
                     self.logger.warning("Scaling failed for %s: %s", key, exc)
 
-            setattr(self, key, value)
+            values[key] = value
+
+        self._values = values
+        self._json_cache = {}
 
     # -------------------------
     # Output Helpers
     # -------------------------
     def get_registers_as_json(self, group: Optional[PollGroup] = None) -> Dict[str, Any]:
+        values = self._values
         if group:
-            return {r: getattr(self, r) for r, v in REGISTERS.items() if v.group == group}
-        return {r: getattr(self, r) for r in REGISTERS.keys()}
+            return {r: values[r] for r in REGISTER_NAMES_BY_GROUP[group]}
+        return dict(values)
+
+    def get_registers_as_bytes(self, group: Optional[PollGroup] = None) -> bytes:
+        """Register values as UTF-8 encoded JSON, for consumers that send or store the dump."""
+        key = ("registers", group)
+        data = self._json_cache.get(key)
+        if data is None:
+            data = self._json_cache[key] = orjson.dumps(self.get_registers_as_json(group))
+        return data
+
+    def get_ha_sensors_as_bytes(self, group: Optional[PollGroup] = None) -> bytes:
+        """`get_ha_sensors` as UTF-8 encoded JSON, shared by all requests until the next register update."""
+        key = ("ha_sensors", group)
+        data = self._json_cache.get(key)
+        if data is None:
+            data = self._json_cache[key] = orjson.dumps(self.get_ha_sensors(group))
+        return data
 
     def get_ha_sensors(self, group: Optional[PollGroup] = None) -> Dict[str, dict]:
         """
@@ -145,42 +510,40 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         :param group: Optional PollGroup to filter (e.g., PollGroup.POLL)
         :return: dict keyed by register name containing HA sensor metadata and state
         """
-        sensors: Dict[str, dict] = {}
-        serial = getattr(self, "c_serialnumber", "unknown")
-
-        for name, reg in REGISTERS.items():
-            # Filter by group if requested
-            if group and reg.group != group:
-                continue
-
-            # Skip registers without HA metadata
-            if not reg.ha:
-                continue
-
-            # Skip scale factor registers themselves
-            if name.endswith("_scale"):
-                continue
-
-            # self.logger.DEBUG(f"Processing register for HA sensor: {name}, reg: {reg}, value: {getattr(self, name, None)}")
-
-            # Get scaled values
-            value = getattr(self, name, None)
-
-            # Build HA sensor dictionary
-            sensors[name] = {
-                "state": value,
-                "unit": reg.ha.unit,
-                "device_class": reg.ha.device_class,
-                "state_class": reg.ha.state_class,
-                "entity_category": reg.ha.entity_category,
-                "icon": reg.ha.icon,
-                "friendly_name": reg.ha.friendly_name or name.replace("_", " ").title(),
-                "description": reg.ha.description,
-                "unique_id": f"{serial}_{name}",
-                "available": value is not None,
+        values = self._values
+        return {
+            name: {**template, "state": values[name], "available": values[name] is not None}
+            for name, template in self._ha_template(group).items()
+        }
+
+    def _ha_template(self, group: Optional[PollGroup]) -> Dict[str, dict]:
+        """Static HA metadata per register, rebuilt only when the serial number changes."""
+        serial = self._values["c_serialnumber"]
+        if serial != self._ha_serial:
+            self._ha_templates = {}
+            self._ha_serial = serial
+
+        templates = self._ha_templates.get(group)
+        if templates is None:
+            # HA_REGISTERS* already skip registers without HA metadata and scale factors
+            registers = HA_REGISTERS_BY_GROUP[group] if group else HA_REGISTERS
+            templates = {
+                name: {
+                    "state": None,
+                    "unit": reg.ha.unit,
+                    "device_class": reg.ha.device_class,
+                    "state_class": reg.ha.state_class,
+                    "entity_category": reg.ha.entity_category,
+                    "icon": reg.ha.icon,
+                    "friendly_name": reg.ha.friendly_name or name.replace("_", " ").title(),
+                    "description": reg.ha.description,
+                    "unique_id": f"{serial}_{name}",
+                    "available": False,
+                }
+                for name, reg in registers.items()
             }
-
-        return sensors
+            self._ha_templates[group] = templates
+        return templates
 
     def get_control_data(self) -> Dict[str, Any]:
         """
@@ -190,26 +553,22 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
             dict: Dictionary with current solar production, current power limit of the inverter, 
                 and the time when the data was last updated.
         """
-        control_data: Dict[str, Any] = {}
-
-        # Filter POLL group registers
-        current_data = {r: getattr(self, r) for r, v in REGISTERS.items() if v.group == PollGroup.POLL}
+        values = self._values
 
         # Map to control loop keys
-        control_data["solar_production"] = current_data.get("power_ac")  # assuming power_ac represents solar production
-        control_data["power_limit"] = getattr(self, "active_power_limit", None)
-        control_data["last_updated"] = getattr(self, "last_updated", None)
-
-        return control_data
+        return {
+            "solar_production": values["power_ac"],  # assuming power_ac represents solar production
+            "power_limit": values["active_power_limit"],
+            "last_updated": self.last_updated,
+        }
 
 
     def print_registers(self, group: Optional[PollGroup] = None) -> None:
         data = self.get_registers_as_json(group)
-        print(f"\n{'Register':<30} | Value")
-        print("-" * 45)
-        for k, v in data.items():
-            print(f"{k:<30} | {v}")
-        print()
+        rows = [f"\n{'Register':<30} | Value\n", "-" * 45 + "\n"]
+        rows.extend(f"{k:<30} | {v}\n" for k, v in data.items())
+        rows.append("\n")
+        sys.stdout.write("".join(rows))
 
     # -------------------------
     # Async Power Control
@@ -218,28 +577,16 @@ class SolarEdgeInverter(solaredge_modbus.Inverter):
         if not (0 <= limit <= 100):
             raise ValueError("Limit must be between 0 and 100.")
 
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._sync_set_production_limit, limit)
+        await self._run_io(self._sync_set_production_limit, limit)
 
     def _sync_set_production_limit(self, limit: int) -> None:
-        self.connect()
-        try:
-            if not self.connected():
-                raise ConnectionError("Failed to connect to inverter")
+        with self._session():
             self.write("active_power_limit", limit)
-        finally:
-            self.disconnect()
 
     async def restore_power_control_defaults(self) -> None:
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._sync_restore_defaults)
+        await self._run_io(self._sync_restore_defaults)
 
     def _sync_restore_defaults(self) -> None:
-        self.connect()
-        try:
-            if not self.connected():
-                raise ConnectionError("Failed to connect to inverter")
+        with self._session():
             self.write("restore_power_control_default_settings", 1)
             self.write("active_power_limit", 100)
-        finally:
-            self.disconnect()
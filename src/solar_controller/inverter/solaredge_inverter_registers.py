@@ -1,6 +1,7 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping
 
 
 class PollGroup(Enum):
@@ -13,7 +14,7 @@ class PollGroup(Enum):
 # -----------------------------------
 # Home Assistant metadata
 # -----------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HARegisterMeta:
     unit: Optional[str]
     device_class: Optional[str]
@@ -27,7 +28,7 @@ class HARegisterMeta:
 # -----------------------------------
 # Register definition
 # -----------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterDef:
     scale: Optional[str]
     group: PollGroup
@@ -35,9 +36,9 @@ class RegisterDef:
 
 
 # -----------------------------------
-# Registers
+# Registers (read-only view; the table is static)
 # -----------------------------------
-REGISTERS: Dict[str, RegisterDef] = {
+REGISTERS: Mapping[str, RegisterDef] = MappingProxyType({
     # -------------------------------
     # SunSpec identity
     # -------------------------------
@@ -200,6 +201,11 @@ REGISTERS: Dict[str, RegisterDef] = {
                        "Inverter Temperature", "Internal temperature of inverter"),
     ),
 
+    # -------------------------------
+    # CONTROL – power control (F001, percent of maximum power)
+    # -------------------------------
+    "active_power_limit": RegisterDef(None, PollGroup.CONTROL),
+
     # -------------------------------
     # Scaling registers (internal only)
     # -------------------------------
@@ -214,4 +220,30 @@ REGISTERS: Dict[str, RegisterDef] = {
     "power_reactive_scale": RegisterDef(None, PollGroup.POLL),
     "power_factor_scale": RegisterDef(None, PollGroup.POLL),
     "current_dc_scale": RegisterDef(None, PollGroup.POLL),
+})
+
+
+# -----------------------------------
+# Group partitions (built once at import)
+# -----------------------------------
+# Every register name, for membership tests
+REGISTER_NAMES: frozenset[str] = frozenset(REGISTERS)
+REGISTERS_BY_GROUP: Dict[PollGroup, Dict[str, RegisterDef]] = {
+    group: {name: reg for name, reg in REGISTERS.items() if reg.group == group}
+    for group in PollGroup
+}
+# Register names per group, in table order
+REGISTER_NAMES_BY_GROUP: Dict[PollGroup, tuple[str, ...]] = {
+    group: tuple(registers) for group, registers in REGISTERS_BY_GROUP.items()
+}
+# Scale-factor register of every scaled register; unscaled registers are absent
+SCALE_OF: Dict[str, str] = {name: reg.scale for name, reg in REGISTERS.items() if reg.scale}
+
+# Registers exposed as Home Assistant sensors (scale factors excluded)
+HA_REGISTERS: Dict[str, RegisterDef] = {
+    name: reg for name, reg in REGISTERS.items() if reg.ha and not name.endswith("_scale")
+}
+HA_REGISTERS_BY_GROUP: Dict[PollGroup, Dict[str, RegisterDef]] = {
+    group: {name: reg for name, reg in HA_REGISTERS.items() if reg.group == group}
+    for group in PollGroup
 }
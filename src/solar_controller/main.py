@@ -10,17 +10,45 @@ from solar_controller.factories.sensor_factory import create_sensor
 from solar_controller.factories.inverter_factory import create_inverter
 from solar_controller.controller.solar_regulator import SolarRegulator
 
+# Control cycle period in seconds, measured start to start
+CYCLE_SECONDS = 10.0
+
+
+async def _sleep_until(deadline: float) -> float:
+    """
+    Sleep until `deadline` on the event-loop clock and return the deadline to schedule from.
+
+    An overrun cycle is re-anchored to "now" instead of firing a burst of catch-up cycles.
+    """
+    now = asyncio.get_running_loop().time()
+    if deadline < now:
+        logging.warning("Control cycle overran by %.2fs", now - deadline)
+        return now
+    await asyncio.sleep(deadline - now)
+    return deadline
+
+
+async def _stop_server(server_task: asyncio.Task) -> None:
+    """Cancel the HTTP server task if it is still starting, otherwise release its runner."""
+    server_task.cancel()  # no-op once start_server has returned
+    try:
+        runner = await server_task
+    except asyncio.CancelledError:
+        return
+    except Exception as e:
+        logging.error("HTTP server failed: %s", e)
+        return
+    await runner.cleanup()
+
 
 async def main(stop_event: asyncio.Event | None = None):
     """
     Main async loop for Solar Controller.
     Gracefully handles signals to allow clean shutdown.
     """
-    # Use provided stop_event or create a new one
-    stop_event = stop_event or asyncio.Event()
-
     # Only register OS signals if no stop_event was provided (i.e., production)
-    if stop_event.is_set() is False:
+    if stop_event is None:
+        stop_event = asyncio.Event()
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, stop_event.set)
@@ -33,8 +61,8 @@ async def main(stop_event: asyncio.Event | None = None):
     inverter = create_inverter(config.inverter)
     regulator = SolarRegulator()
 
-    # Start HTTP heartbeat server
-    asyncio.create_task(start_server(config, inverter=inverter))
+    # Start HTTP heartbeat server; keep the task so it is not garbage collected and can be cleaned up
+    server_task = asyncio.create_task(start_server(config, inverter=inverter), name="http_server")
 
     # Connect to devices
     await reader.ensure_connected()
@@ -42,7 +70,9 @@ async def main(stop_event: asyncio.Event | None = None):
         logging.error("Failed to connect to ESPHome reader.")
         sys.exit(1)
 
-    if not await inverter.check_connection():
+    try:
+        await inverter.open()
+    except ConnectionError:
         logging.error("Failed to connect to SolarEdge inverter.")
         sys.exit(1)
 
@@ -50,35 +80,63 @@ async def main(stop_event: asyncio.Event | None = None):
     new_current_price = 0.0
     new_negative_price = False
 
+    # Shared server state, bound once; the loop only mutates these objects
+    status, history, control = STATUS, HISTORY, CONTROL
+
     i = 0
+    next_tick = asyncio.get_running_loop().time()
     try:
         while not stop_event.is_set():
-            # --- Inverter ---
-            await inverter.read_all_registers()
+            next_tick += CYCLE_SECONDS
+            # --- Inverter + ESPHome sensor (overlapping I/O) ---
+            # A failure on one side skips the cycle instead of ending the loop
+            inverter_result, sensor_esp = await asyncio.gather(
+                inverter.read_all_registers(),
+                reader.read_control_data(),
+                return_exceptions=True,
+            )
+            # CancelledError is a BaseException, not an Exception: let cancellation propagate
+            for result in (inverter_result, sensor_esp):
+                if isinstance(result, BaseException) and not isinstance(result, Exception):
+                    raise result
+            if isinstance(inverter_result, Exception) or isinstance(sensor_esp, Exception):
+                logging.warning(
+                    "Device read failed (inverter: %r, sensor: %r), skipping this cycle.",
+                    inverter_result, sensor_esp if isinstance(sensor_esp, Exception) else None,
+                )
+                next_tick = await _sleep_until(next_tick)
+                continue
             inverter_data = inverter.get_registers_as_json()
             solar_production = inverter_data["power_ac"]
-            logging.debug(f"Current solar production: {solar_production} W")
+            logging.debug("Current solar production: %s W", solar_production)
+            # Failed inverter reads surface as None/stale values rather than exceptions
+            if type(solar_production) not in (int, float):
+                logging.warning("Invalid solar production reading: %s W, skipping this cycle.", solar_production)
+                next_tick = await _sleep_until(next_tick)
+                continue
 
-            # --- ESPHome sensor ---
-            sensor_esp = reader.get_control_data()
             current_export, _ = sensor_esp["grid_export_power"]
             current_import, _ = sensor_esp["grid_import_power"]
 
-            logging.debug(f"Current export: {current_export} W, Current import: {current_import} W")
+            logging.debug("Current export: %s W, Current import: %s W", current_export, current_import)
 
             # --- Compute consumption ---
-            if not isinstance(current_import, int) or not isinstance(current_export, int):
-                logging.warning(f"Invalid sensor readings: Import {current_import} W, Export {current_export} W, skipping this cycle.")
-                await asyncio.sleep(10)
+            # Exact type checks: readings are plain ints on the happy path (bool is rejected too)
+            if type(current_import) is not int or type(current_export) is not int:
+                logging.warning(
+                    "Invalid sensor readings: Import %s W, Export %s W, skipping this cycle.",
+                    current_import, current_export,
+                )
+                next_tick = await _sleep_until(next_tick)
                 continue
             grid_consumption = current_import - current_export
             home_consumption = abs(solar_production - grid_consumption)
-            logging.debug(f"Grid consumption: {grid_consumption} W, Home consumption: {home_consumption} W")
+            logging.debug("Grid consumption: %s W, Home consumption: %s W", grid_consumption, home_consumption)
 
             # --- Compute new scale factor ---
-            if not isinstance(new_current_price, float) or not isinstance(new_negative_price, bool):
+            if new_current_price is None or type(new_negative_price) is not bool:
                 logging.warning("Invalid price reading or negative_price, skipping this cycle.")
-                await asyncio.sleep(10)
+                next_tick = await _sleep_until(next_tick)
                 continue
             
             scale_factor = regulator.new_scale_factor(
@@ -87,30 +145,34 @@ async def main(stop_event: asyncio.Event | None = None):
                 updated_current_price=new_current_price,
                 updated_negative_price=new_negative_price
             )
-            logging.debug(f"Computed scale factor: {scale_factor} %")
+            logging.debug("Computed scale factor: %s %%", scale_factor)
 
             logging.info(
-                f"Cycle {i+1}: Grid={grid_consumption} W, Home={home_consumption} W, "
-                f"Solar={solar_production} W, Scale Factor={scale_factor} %"
-                f", Price={new_current_price} kr/kWh, Negative Price={new_negative_price}"
+                "Cycle %d: Grid=%s W, Home=%s W, Solar=%s W, Scale Factor=%s %%, "
+                "Price=%s kr/kWh, Negative Price=%s",
+                i + 1, grid_consumption, home_consumption, solar_production, scale_factor,
+                new_current_price, new_negative_price,
             )
 
             # --- Update STATUS, HISTORY, CONTROL ---
-            STATUS.update({
-                "grid_consumption": grid_consumption,
-                "home_consumption": home_consumption,
-                "solar_production": solar_production,
-                "new_scale_factor": scale_factor,
-                "last_update": time.time()
-            })
-            for key in HISTORY:
-                HISTORY[key].append(STATUS[key])
-
-            new_current_price = CONTROL.get("current_price")
-            new_negative_price = CONTROL.get("negative_price")
+            # Item assignment into the existing keys; no throwaway dict per cycle
+            status["grid_consumption"] = grid_consumption
+            status["home_consumption"] = home_consumption
+            status["solar_production"] = solar_production
+            status["new_scale_factor"] = scale_factor
+            status["last_update"] = time.time()
+            for key, hist in history.items():
+                hist.append(status[key])
+
+            # Coerce once here so the next cycle only needs identity/type checks
+            try:
+                new_current_price = float(control.get("current_price"))
+            except (TypeError, ValueError):
+                new_current_price = None
+            new_negative_price = control.get("negative_price")
 
             i += 1
-            await asyncio.sleep(10)  # loop interval
+            next_tick = await _sleep_until(next_tick)
 
     except Exception as e:
         logging.exception("Exception in main loop: %s", e)
@@ -118,7 +180,8 @@ async def main(stop_event: asyncio.Event | None = None):
     finally:
         logging.info("Shutting down, disconnecting devices...")
         await reader.disconnect()
-        # await inverter.disconnect()
+        await inverter.close()
+        await _stop_server(server_task)
         logging.info("Shutdown complete.")
 
 
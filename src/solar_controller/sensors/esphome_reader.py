@@ -1,7 +1,9 @@
 import asyncio
 import logging
-import math
+import random
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Literal
 
 from aioesphomeapi import (
@@ -12,6 +14,59 @@ from aioesphomeapi import (
     TextSensorInfo,
 )
 
+# Pending state updates kept before the oldest is dropped
+STATE_QUEUE_SIZE = 512
+# Maximum number of updates applied per worker wake-up
+STATE_BATCH_SIZE = 64
+
+# (value, last_updated) reported for entities without a state yet
+_NO_STATE = ("", None)
+
+
+def _format_sensor(value: Any) -> Any:
+    return value if value == "" else round(value, 1)
+
+
+def _format_binary_sensor(value: Any) -> str:
+    return "ON" if value else "OFF"
+
+
+def _format_text_sensor(value: Any) -> Any:
+    return value
+
+
+# Display formatting per entity kind, resolved by lookup instead of a type/kind branch chain
+_VALUE_FORMATTERS = {
+    "sensor": _format_sensor,
+    "binary_sensor": _format_binary_sensor,
+    "text_sensor": _format_text_sensor,
+}
+
+def _pack_sensor(ent: SensorInfo) -> tuple[str, str, str, str]:
+    return (ent.object_id, ent.name, ent.unit_of_measurement or "", "sensor")
+
+
+def _pack_binary_sensor(ent: BinarySensorInfo) -> tuple[str, str, str, str]:
+    return (ent.object_id, ent.name, "", "binary_sensor")
+
+
+def _pack_text_sensor(ent: TextSensorInfo) -> tuple[str, str, str, str]:
+    return (ent.object_id, ent.name, "", "text_sensor")
+
+
+# Entity info class -> meta tuple builder; other entity types are ignored
+_META_PACKERS = {
+    SensorInfo: _pack_sensor,
+    BinarySensorInfo: _pack_binary_sensor,
+    TextSensorInfo: _pack_text_sensor,
+}
+
+# ESPHome object_id -> standardized control-data key
+CONTROL_KEY_MAPPING = {
+    "momentary_active_import": "grid_import_power",
+    "momentary_active_export": "grid_export_power",
+}
+
 
 class ESPHomeReader:
     def __init__(
@@ -21,6 +76,7 @@ class ESPHomeReader:
         encryption_key: str,
         reconnect_delay: float = 5.0,
         stale_timeout: float = 30.0,
+        reconnect_cap: float = 60.0,
     ):
         """
         Initialize an ESPHome reader instance.
@@ -46,19 +102,24 @@ class ESPHomeReader:
             and encrypt the API connection.
 
         reconnect_delay : float, optional
-            Number of seconds to wait before retrying a failed connection attempt.
+            Base delay in seconds for retrying a failed connection attempt.
+            Retries back off exponentially with full jitter: attempt n waits a
+            random time up to min(reconnect_cap, reconnect_delay * 2**n).
             Defaults to 5.0 seconds.
         
         stale_timeout : float, optional
             Number of seconds without receiving any state updates before
             considering the connection stale and attempting to reconnect.
 
+        reconnect_cap : float, optional
+            Upper bound in seconds for the reconnect backoff. Defaults to 60.0 seconds.
+
         Notes
         -----
         - Calling `get_data_as_json()` before `ensure_connected()` will raise
         a RuntimeError.
-        - All discovered entities are waited for on initial connection, up to
-        a timeout, before data access is allowed.
+        - `ensure_connected()` waits, up to a timeout, for the first state
+        update; entities that have not reported yet read as empty values.
         - Sensor values are updated asynchronously via ESPHome state callbacks.
         `stale_timeout` seconds after connection.
         """
@@ -66,89 +127,151 @@ class ESPHomeReader:
         self.port = port
         self.encryption_key = encryption_key
         self.reconnect_delay = reconnect_delay
+        self.reconnect_cap = reconnect_cap
+        # Failed connection attempts since the last successful connect
+        self._reconnect_attempts = 0
 
         self.client: APIClient | None = None
         self.meta: dict[int, tuple[str, str, str, Literal["sensor", "binary_sensor", "text_sensor"]]] = {}
-        self.states: dict[int, dict[str, object]] = {}
+        # (value, last_updated) per entity key
+        self.states: dict[int, tuple[object, float]] = {}
+        # Read-only live view of self.states; the dict is only ever cleared in place
+        self._states_view: Mapping[int, tuple[object, float]] = MappingProxyType(self.states)
+        # (value, last_updated) per object_id, kept current by the state worker
+        self._latest: dict[str, tuple[object, float | None]] = {}
+        # object_id -> entity key, rebuilt whenever self.meta is replaced or rediscovered
+        self._key_by_object_id: dict[str, int] = {}
+        self._key_index_meta: dict | None = None
 
         self._connected = False
         self._connecting_lock = asyncio.Lock()
         self._first_state_event = asyncio.Event()
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        # NEW: watchdog state
+        # Watchdog state: one timer armed for the stale deadline, no polling task
         self._stale_timeout = float(stale_timeout)
         self._last_rx_monotonic: float | None = None
-        self._watchdog_task: asyncio.Task | None = None
-        self._reconnect_lock = asyncio.Lock()
+        self._stale_timer: asyncio.TimerHandle | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        # Set while a stale-stream reconnect runs; a plain flag suffices on the single-threaded loop
+        self._reconnecting = False
+
+        # State updates are queued by the callback and applied in batches
+        self._state_queue: asyncio.Queue[tuple[Any, Any]] = asyncio.Queue(maxsize=STATE_QUEUE_SIZE)
+        self._state_task: asyncio.Task | None = None
 
     # ---------- INTERNAL CALLBACK ----------
     def _on_state(self, msg: Any) -> None:
-        """Callback for ESPHome state updates."""
-        # NEW: any update means the connection is alive
+        """Callback for ESPHome state updates; processing is deferred to the state worker."""
+        item = (getattr(msg, "key", None), getattr(msg, "state", None))
+        try:
+            self._state_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Keep the newest data: drop the oldest pending update
+            self._state_queue.get_nowait()
+            self._state_queue.put_nowait(item)
+
+    def _ensure_state_worker(self) -> None:
+        if self._state_task is None or self._state_task.done():
+            self._state_task = asyncio.create_task(self._state_worker())
+
+    async def _state_worker(self) -> None:
+        """Drain queued state updates in batches."""
+        queue = self._state_queue
+        while True:
+            items = [await queue.get()]
+            while not queue.empty() and len(items) < STATE_BATCH_SIZE:
+                items.append(queue.get_nowait())
+            self._apply_batch(items)
+
+    def _apply_batch(self, items: list[tuple[Any, Any]]) -> None:
+        """Store a batch of raw (key, state) updates with a shared timestamp."""
+        meta = self.meta
+        states = self.states
+        latest = self._latest
+        # Clocks are read once per batch, not per message; any update means the connection is alive
+        now = time.time()
         self._last_rx_monotonic = time.monotonic()
 
-        key = getattr(msg, "key", None)
-        if key not in self.meta:
-            return
+        for key, state in items:
+            entry = meta.get(key)
+            if entry is None:
+                continue
 
-        kind = self.meta[key][3]
-        value = None
+            kind = entry[3]
+            value = None
 
-        if kind == "sensor":
-            value = msg.state
-            if value is None or (isinstance(value, float) and math.isnan(value)):
-                return
-        elif kind == "binary_sensor":
-            value = bool(msg.state)
-        elif kind == "text_sensor":
-            if msg.state is not None:
-                value = msg.state
+            if kind == "sensor":
+                value = state
+                # value != value is the NaN test (ints always compare equal to themselves)
+                if value is None or value != value:
+                    continue
+            elif kind == "binary_sensor":
+                value = bool(state)
+            elif kind == "text_sensor":
+                if state is not None:
+                    value = state
 
-        # Store value with timestamp
-        self.states[key] = {"value": value, "last_updated": time.time()}
+            # Store value with timestamp; one tuple shared by both views
+            states[key] = latest[entry[0]] = (value, now)
 
         # Signal first data
-        if not self._first_state_event.is_set():
+        if states and not self._first_state_event.is_set():
             self._first_state_event.set()
 
-    # ---------- NEW: WATCHDOG ----------
-    def _ensure_watchdog(self) -> None:
-        if self._watchdog_task is None or self._watchdog_task.done():
-            self._watchdog_task = asyncio.create_task(self._watchdog_loop())
+    # ---------- WATCHDOG ----------
+    def _arm_stale_timer(self, delay: float) -> None:
+        """(Re)schedule the stale-stream check `delay` seconds from now."""
+        if self._stale_timer is not None:
+            self._stale_timer.cancel()
+        self._stale_timer = asyncio.get_running_loop().call_later(delay, self._check_stale)
 
-    async def _watchdog_loop(self) -> None:
-        # simple polling interval; small enough to react quickly
-        poll_s = max(1.0, min(2.0, self._stale_timeout / 10.0))
+    def _cancel_stale_timer(self) -> None:
+        if self._stale_timer is not None:
+            self._stale_timer.cancel()
+            self._stale_timer = None
 
-        while True:
-            await asyncio.sleep(poll_s)
+    def _check_stale(self) -> None:
+        """
+        Timer callback at the earliest moment the stream could be stale.
 
-            if not self._connected:
-                continue
+        Updates do not touch the timer; if one arrived since it was armed, the
+        check re-arms for the remaining time, so a healthy stream costs one
+        wake-up per `stale_timeout` instead of a polling loop.
+        """
+        self._stale_timer = None
+        last = self._last_rx_monotonic
+        if not self._connected or last is None:
+            return
 
-            last = self._last_rx_monotonic
-            if last is None:
-                # connected but no first state yet; give it time
-                continue
+        idle = time.monotonic() - last
+        if idle < self._stale_timeout:
+            self._arm_stale_timer(self._stale_timeout - idle)
+            return
 
-            if (time.monotonic() - last) <= self._stale_timeout:
-                continue
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect_stale())
 
-            # stale stream => reconnect (serialize to avoid stampedes)
-            async with self._reconnect_lock:
-                # re-check inside lock
-                last2 = self._last_rx_monotonic
-                if (not self._connected) or (last2 is None):
-                    continue
-                if (time.monotonic() - last2) <= self._stale_timeout:
-                    continue
+    async def _reconnect_stale(self) -> None:
+        # avoid stampedes: only one stale reconnect at a time, re-checking once it owns the flag
+        if self._reconnecting:
+            return
+        self._reconnecting = True
+        try:
+            last = self._last_rx_monotonic
+            if (not self._connected) or (last is None):
+                return
+            if (time.monotonic() - last) <= self._stale_timeout:
+                self._arm_stale_timer(self._stale_timeout)
+                return
 
-                self.logger.warning(
-                    "ESPHome stream stale (no updates for > %.1fs). Reconnecting...",
-                    self._stale_timeout,
-                )
-                await self._reconnect_once()
+            self.logger.warning(
+                "ESPHome stream stale (no updates for > %.1fs). Reconnecting...",
+                self._stale_timeout,
+            )
+            await self._reconnect_once()
+        finally:
+            self._reconnecting = False
 
     async def _reconnect_once(self) -> None:
         await self.disconnect()
@@ -156,12 +279,19 @@ class ESPHomeReader:
             try:
                 await self.connect()
             except APIConnectionError as e:
+                delay = self._next_backoff()
                 self.logger.warning(
-                    "Reconnect failed, retrying in %ss, problem encountered %s",
-                    self.reconnect_delay,
+                    "Reconnect failed, retrying in %.1fs, problem encountered %s",
+                    delay,
                     e,
                 )
-                await asyncio.sleep(self.reconnect_delay)
+                await asyncio.sleep(delay)
+
+    def _next_backoff(self) -> float:
+        """Full-jitter exponential backoff delay for the next reconnect attempt."""
+        ceiling = min(self.reconnect_cap, self.reconnect_delay * (2 ** min(self._reconnect_attempts, 6)))
+        self._reconnect_attempts += 1
+        return random.uniform(0, ceiling)
 
     # ---------- CONNECTION MANAGEMENT ----------
     async def connect(self) -> None:
@@ -180,13 +310,15 @@ class ESPHomeReader:
             try:
                 await self.client.connect(login=True)
                 await self._discover_entities()
+                self._ensure_state_worker()
                 self.client.subscribe_states(self._on_state)
 
                 self._connected = True
+                self._reconnect_attempts = 0
 
-                # NEW: initialize RX time and start watchdog
+                # Initialize RX time and arm the stale-stream timer
                 self._last_rx_monotonic = time.monotonic()
-                self._ensure_watchdog()
+                self._arm_stale_timer(self._stale_timeout)
 
                 self.logger.info("Connected. Discovered %d entities.", len(self.meta))
             except APIConnectionError:
@@ -201,92 +333,88 @@ class ESPHomeReader:
             self.client = None
         self._connected = False
         self._last_rx_monotonic = None
+        self._cancel_stale_timer()
         self._first_state_event.clear()
+        await self._stop_state_worker()
+
+    async def _stop_state_worker(self) -> None:
+        """Cancel the state worker and discard updates queued by the old connection."""
+        task = self._state_task
+        self._state_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        queue = self._state_queue
+        while not queue.empty():
+            queue.get_nowait()
 
     async def _discover_entities(self):
         entities, _ = await self.client.list_entities_services()
         self.meta.clear()
         self.states.clear()
 
+        meta = self.meta
+        packers = _META_PACKERS
         for ent in entities:
-            if isinstance(ent, SensorInfo):
-                self.meta[ent.key] = (
-                    ent.object_id,
-                    ent.name,
-                    ent.unit_of_measurement or "",
-                    "sensor",
-                )
-            elif isinstance(ent, BinarySensorInfo):
-                self.meta[ent.key] = (
-                    ent.object_id,
-                    ent.name,
-                    "",
-                    "binary_sensor",
-                )
-            elif isinstance(ent, TextSensorInfo):
-                self.meta[ent.key] = (
-                    ent.object_id,
-                    ent.name,
-                    "",
-                    "text_sensor",
-                )
+            packer = packers.get(type(ent))
+            if packer is not None:
+                meta[ent.key] = packer(ent)
 
         if not self.meta:
             raise RuntimeError("No ESPHome entities found")
 
+        self._latest = {obj_id: _NO_STATE for obj_id, _name, _unit, _kind in self.meta.values()}
+        self._key_index_meta = None
+
     # ---------- PUBLIC API ----------
     async def ensure_connected(self, timeout: float = 3.0) -> None:
-        """Connect and wait until all entities have reported at least once."""
+        """Connect and wait until the device has reported its first state."""
         while not self._connected:
             try:
                 await self.connect()
             except APIConnectionError as e:
+                delay = self._next_backoff()
                 self.logger.warning(
-                    f"Retrying ESPHome connection in {self.reconnect_delay}s, problem encountered {e}"
+                    "Retrying ESPHome connection in %.1fs, problem encountered %s", delay, e
                 )
-                await asyncio.sleep(self.reconnect_delay)
+                await asyncio.sleep(delay)
                 continue
 
-        # Wait until all entities have reported (kept as-is from your current code)
-        start_time = asyncio.get_event_loop().time()
-        while True:
-            missing = [k for k in self.meta if k not in self.states]
-            if not missing:
-                break
-
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                self.logger.warning("Some ESPHome sensors did not report in time: %s", missing)
-                break
+        # Partial readiness: entities that have not reported yet read as "" until they do
+        if self._first_state_event.is_set() or self.states:
+            return
+        try:
+            await asyncio.wait_for(self._first_state_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("ESPHome reported no states within %ss", timeout)
 
-            await asyncio.sleep(0.05)
+    def get_latest_states(self) -> Mapping[int, tuple[object, float]]:
+        """
+        Read-only live view of the (value, last_updated) state per entity key.
 
-    def get_latest_states(self) -> dict:
-        return self.states.copy()
+        The view is not a snapshot: it reflects later updates and cannot be
+        modified. Use ``dict(reader.get_latest_states())`` for an independent copy.
+        """
+        return self._states_view
 
     def get_sensor_data_as_json(self) -> dict:
         if not self._connected:
             raise RuntimeError("ESPHome device not connected. Call ensure_connected() first.")
 
+        states = self.states
+        formatters = _VALUE_FORMATTERS
         data = {}
         for key, (obj_id, name, unit, kind) in self.meta.items():
-            state = self.states.get(key)
-            if state is None:
-                value = ""
-                last_updated = None
-            else:
-                value = state["value"]
-                last_updated = state["last_updated"]
-
-            if kind == "binary_sensor":
-                value = "ON" if value else "OFF"
-            elif isinstance(value, (int, float)):
-                value = round(value, 1)
-
+            value, last_updated = states.get(key, _NO_STATE)
             data[key] = {
                 "object_id": obj_id,
                 "name": name,
                 "unit": unit,
-                "value": value,
+                "value": formatters[kind](value),
                 "last_updated": last_updated,
             }
         return data
@@ -295,27 +423,42 @@ class ESPHomeReader:
         if not self._connected:
             raise RuntimeError("ESPHome device not connected. Call ensure_connected() first.")
 
-        simplified: dict[str, tuple] = {}
-        for key, (obj_id, _name, _unit, _kind) in self.meta.items():
-            state = self.states.get(key)
-            if state is None:
-                simplified[obj_id] = ("", None)
-            else:
-                simplified[obj_id] = (state["value"], state["last_updated"])
-        return simplified
+        return dict(self._latest)
+
+    async def read_control_data(self, timeout: float = 3.0) -> dict[str, list[int | str | None]]:
+        """
+        Return `get_control_data()`, making one reconnect attempt first if the connection was lost.
+
+        The attempt is bounded by `timeout` and not retried, so during an outage
+        the caller gets a RuntimeError and can skip its cycle instead of waiting
+        on `ensure_connected()`'s retry loop.
+        """
+        if not self._connected:
+            try:
+                await asyncio.wait_for(self.connect(), timeout)
+            except (APIConnectionError, asyncio.TimeoutError) as e:
+                raise RuntimeError(f"ESPHome device not connected: {e!r}") from e
+        return self.get_control_data()
+
+    def _object_id_index(self) -> dict[str, int]:
+        """object_id -> entity key for the current meta (first entity wins on duplicates)."""
+        meta = self.meta
+        if self._key_index_meta is not meta:
+            index: dict[str, int] = {}
+            for key, entry in meta.items():
+                index.setdefault(entry[0], key)
+            self._key_by_object_id = index
+            self._key_index_meta = meta
+        return self._key_by_object_id
 
     def get_control_data(self) -> dict[str, list[int | str | None]]:
         if not self._connected:
             raise RuntimeError("ESPHome device not connected. Call ensure_connected() first.")
 
-        CONTROL_KEY_MAPPING = {
-            "momentary_active_import": "grid_import_power",
-            "momentary_active_export": "grid_export_power",
-        }
-
+        key_by_object_id = self._object_id_index()
         standardized: dict[str, list[int | str | None]] = {}
         for esphome_key, std_key in CONTROL_KEY_MAPPING.items():
-            key = next((k for k, v in self.meta.items() if v[0] == esphome_key), None)
+            key = key_by_object_id.get(esphome_key)
             if key is None:
                 standardized[std_key] = ["", None]
                 continue
@@ -324,7 +467,7 @@ class ESPHomeReader:
             if state is None:
                 standardized[std_key] = ["", None]
             else:
-                val = int(state["value"] * 1000)  # kW to W
-                standardized[std_key] = [val, state["last_updated"]]
+                value, last_updated = state
+                standardized[std_key] = [int(value * 1000), last_updated]  # kW to W
 
         return standardized
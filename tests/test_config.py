@@ -0,0 +1,42 @@
+import pytest
+from solar_controller import config
+from solar_controller.config import load_config
+
+CONFIG_YAML = """\
+DEBUG_LEVEL: "INFO"
+
+ESP_SENSOR:
+  ESP_READER_HOST: "192.168.1.10"
+  ESP_READER_PORT: 6053
+  ESP_READER_ENCRYPTION_KEY: "key"
+  ESP_READER_WINDOW_SECONDS: 0.5
+
+INVERTER:
+  SOLAR_EDGE_INVERTER_DEVICE: "/dev/ttyUSB0"
+  SOLAR_EDGE_INVERTER_BAUD: 9600
+  SOLAR_EDGE_INVERTER_TIMEOUT: 2
+
+API:
+  TOKEN: "token"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+def test_load_config_reparses_when_file_changes(config_file):
+    load_config(str(config_file))
+    config_file.write_text(CONFIG_YAML.replace("9600", "19200"))
+    assert load_config(str(config_file)).inverter.baud == 19200
+
+
+def test_load_config_reuses_result_in_process(config_file, monkeypatch):
+    first = load_config(str(config_file))
+
+    # Unchanged file: the YAML is not parsed again
+    monkeypatch.setattr(config, "_parse_config", lambda _: pytest.fail("config was re-parsed"))
+    assert load_config(str(config_file)) is first
@@ -1,8 +1,9 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
 import time
 from solar_controller.sensors.esphome_reader import ESPHomeReader
-from aioesphomeapi import SensorInfo, BinarySensorInfo, TextSensorInfo
+from aioesphomeapi import APIConnectionError, SensorInfo, BinarySensorInfo, TextSensorInfo
 
 
 class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
@@ -14,6 +15,13 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
             encryption_key="testkey"
         )
 
+    def _drain_states(self):
+        """Apply queued state updates synchronously"""
+        items = []
+        while not self.reader._state_queue.empty():
+            items.append(self.reader._state_queue.get_nowait())
+        self.reader._apply_batch(items)
+
     @patch("solar_controller.sensors.esphome_reader.APIClient")
     async def test_connect_and_discover_entities(self, MockClient):
         """ESPHome connection and entity discovery"""
@@ -36,8 +44,15 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(self.reader._connected)
         self.assertEqual(len(self.reader.meta), 3)
 
+        state_task = self.reader._state_task
+        self.reader._state_queue.put_nowait((1, 21.5))
+
         await self.reader.disconnect()
         self.assertFalse(self.reader._connected)
+        # The state worker is stopped and stale updates are not carried over
+        self.assertTrue(state_task.cancelled())
+        self.assertIsNone(self.reader._state_task)
+        self.assertTrue(self.reader._state_queue.empty())
 
     async def test_get_control_data_returns_standardized_keys(self):
         """get_control_data returns decoupled standardized keys"""
@@ -45,8 +60,8 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         self.reader._connected = True
         now = time.time()
         self.reader.states = {
-            1: {"value": 5.2, "last_updated": now},
-            2: {"value": 3.1, "last_updated": now}
+            1: (5.2, now),
+            2: (3.1, now)
         }
         self.reader.meta = {
             1: ("momentary_active_import", "Import", "W", "sensor"),
@@ -66,6 +81,34 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(val, 3100)
         self.assertEqual(ts, now)
 
+    async def test_read_control_data_reconnects_when_disconnected(self):
+        """read_control_data makes one connect attempt before reading"""
+        self.reader.meta = {1: ("momentary_active_import", "Import", "W", "sensor")}
+        self.reader.states = {1: (1.0, time.time())}
+
+        async def fake_connect():
+            self.reader._connected = True
+
+        with patch.object(self.reader, "connect", side_effect=fake_connect) as mock_connect:
+            result = await self.reader.read_control_data()
+
+        mock_connect.assert_awaited_once()
+        self.assertEqual(result["grid_import_power"][0], 1000)
+
+    async def test_read_control_data_raises_when_reconnect_fails(self):
+        """read_control_data does not wait out an outage; the caller can skip its cycle"""
+        with patch.object(self.reader, "connect", side_effect=APIConnectionError("down")) as mock_connect:
+            with self.assertRaises(RuntimeError):
+                await self.reader.read_control_data()
+        mock_connect.assert_awaited_once()
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        with patch.object(self.reader, "connect", side_effect=hang):
+            with self.assertRaises(RuntimeError):
+                await self.reader.read_control_data(timeout=0.01)
+
     async def test_get_control_data_returns_default_for_missing_values(self):
         """Missing sensors return '<no value>' and None timestamp"""
         self.reader._connected = True
@@ -84,6 +127,18 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         """get_latest_states returns empty dict if no states yet"""
         self.assertEqual(self.reader.get_latest_states(), {})
 
+    async def test_get_latest_states_is_live_read_only_view(self):
+        """get_latest_states returns a read-only view that reflects later updates"""
+        self.reader.meta = {1: ("sensor_1", "Temp", "C", "sensor")}
+        view = self.reader.get_latest_states()
+        self.assertNotIn(1, view)
+
+        self.reader._apply_batch([(1, 21.5)])
+        self.assertEqual(view[1][0], 21.5)
+        self.assertIs(self.reader.get_latest_states(), view)
+        with self.assertRaises(TypeError):
+            view[2] = (2.0, 123.0)
+
     async def test_on_state_ignores_none_and_nan(self):
         """_on_state ignores None and NaN values"""
         self.reader.meta = {1: ("sensor_1", "Temp", "C", "sensor")}
@@ -94,10 +149,84 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
                 self.state = state
 
         self.reader._on_state(Msg(1, None))
+        self._drain_states()
         self.assertNotIn(1, self.reader.states)
         self.reader._on_state(Msg(1, float("nan")))
+        self._drain_states()
         self.assertNotIn(1, self.reader.states)
 
+    async def test_state_queue_drops_oldest_when_full(self):
+        """A full state queue keeps the newest updates"""
+        self.reader._state_queue = asyncio.Queue(maxsize=2)
+        self.reader.meta = {1: ("sensor_1", "Temp", "C", "sensor")}
+
+        class Msg:
+            def __init__(self, key, state):
+                self.key = key
+                self.state = state
+
+        for value in (1.0, 2.0, 3.0):
+            self.reader._on_state(Msg(1, value))
+        self.assertEqual(self.reader._state_queue.qsize(), 2)
+
+        self._drain_states()
+        self.assertEqual(self.reader.states[1][0], 3.0)
+        self.assertTrue(self.reader._first_state_event.is_set())
+
+    async def test_state_worker_applies_queued_updates(self):
+        """The background worker drains the queue into states"""
+        self.reader.meta = {1: ("sensor_1", "Temp", "C", "sensor")}
+
+        class Msg:
+            def __init__(self, key, state):
+                self.key = key
+                self.state = state
+
+        self.reader._ensure_state_worker()
+        self.reader._on_state(Msg(1, 21.5))
+        await asyncio.sleep(0)
+        self.assertEqual(self.reader.states[1][0], 21.5)
+        self.reader._state_task.cancel()
+
+    async def test_ensure_connected_wakes_on_first_state(self):
+        """ensure_connected returns as soon as any entity reports"""
+        self.reader._connected = True
+        self.reader.meta = {
+            1: ("sensor_1", "Temp", "C", "sensor"),
+            2: ("sensor_2", "Power", "W", "sensor"),
+        }
+
+        waiter = asyncio.create_task(self.reader.ensure_connected(timeout=5.0))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        self.reader._apply_batch([(1, 1.0)])
+        await asyncio.wait_for(waiter, 1.0)
+        self.assertNotIn(2, self.reader.states)
+
+    async def test_reconnect_backoff_grows_and_is_capped(self):
+        """Backoff ceilings double per failed attempt up to reconnect_cap"""
+        self.reader.reconnect_delay = 1.0
+        self.reader.reconnect_cap = 10.0
+        with patch("solar_controller.sensors.esphome_reader.random.uniform", side_effect=lambda lo, hi: hi):
+            delays = [self.reader._next_backoff() for _ in range(6)]
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 8.0, 10.0, 10.0])
+
+    async def test_stale_timer_rearms_while_updates_arrive(self):
+        """The stale check re-arms instead of reconnecting when data is fresh"""
+        self.reader._connected = True
+        self.reader._last_rx_monotonic = time.monotonic()
+        with patch.object(self.reader, "_reconnect_stale", new=AsyncMock()) as mock_reconnect:
+            self.reader._check_stale()
+            self.assertIsNotNone(self.reader._stale_timer)
+            mock_reconnect.assert_not_called()
+            self.reader._cancel_stale_timer()
+
+            self.reader._last_rx_monotonic -= self.reader._stale_timeout + 1
+            self.reader._check_stale()
+            await asyncio.sleep(0)
+            mock_reconnect.assert_awaited_once()
+
     async def test_disconnect_no_client(self):
         """Test disconnect works if client is None"""
         self.reader.client = None
@@ -117,11 +246,13 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
 
         # binary 0 → False
         self.reader._on_state(Msg(1, 0))
-        self.assertEqual(self.reader.states[1]["value"], False)
+        self._drain_states()
+        self.assertEqual(self.reader.states[1][0], False)
 
         # text empty string → ""
         self.reader._on_state(Msg(2, ""))
-        self.assertEqual(self.reader.states[2]["value"], "")
+        self._drain_states()
+        self.assertEqual(self.reader.states[2][0], "")
 
     async def test_ensure_connected_timeout_and_logging(self):
         """ensure_connected logs warning if sensors do not report"""
@@ -132,7 +263,7 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         with patch.object(self.reader.logger, "warning") as mock_warn, patch("asyncio.sleep", new=AsyncMock()):
             await self.reader.ensure_connected(timeout=0.1)
             self.assertTrue(mock_warn.called)
-            self.assertIn("Some ESPHome sensors did not report", mock_warn.call_args[0][0])
+            self.assertIn("ESPHome reported no states", mock_warn.call_args[0][0])
 
     @patch("solar_controller.sensors.esphome_reader.APIClient")
     async def test_get_data_as_json_returns_all_sensors(self, MockClient):
@@ -156,9 +287,9 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         # Fake states
         now = time.time()
         self.reader.states = {
-            1: {"value": 25.0, "last_updated": now},
-            2: {"value": True, "last_updated": now},
-            3: {"value": "OK", "last_updated": now},
+            1: (25.0, now),
+            2: (True, now),
+            3: ("OK", now),
         }
 
         data = self.reader.get_sensor_data_as_json()
@@ -171,6 +302,36 @@ class TestESPHomeReader(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data[2]["value"], "ON")
         self.assertEqual(data[3]["value"], "OK")
 
+    @patch("solar_controller.sensors.esphome_reader.APIClient")
+    async def test_get_data_as_json_returns_snapshot(self, MockClient):
+        mock_client = MockClient.return_value
+        mock_client.connect = AsyncMock()
+        mock_client.list_entities_services = AsyncMock(
+            return_value=(
+                [
+                    SensorInfo(key=1, object_id="sensor_1", name="Temperature", unit_of_measurement="C"),
+                    TextSensorInfo(key=3, object_id="text_1", name="Status"),
+                ],
+                []
+            )
+        )
+        mock_client.subscribe_states = MagicMock()
+
+        await self.reader.connect()
+        self.assertEqual(self.reader.get_data_as_json(), {"sensor_1": ("", None), "text_1": ("", None)})
+
+        self.reader._on_state(MagicMock(key=1, state=21.5))
+        self._drain_states()
+        data = self.reader.get_data_as_json()
+        self.assertEqual(data["sensor_1"][0], 21.5)
+        self.assertIsNotNone(data["sensor_1"][1])
+        self.assertEqual(data["text_1"], ("", None))
+
+        # The returned dict is a copy, later updates do not leak into it
+        self.reader._on_state(MagicMock(key=1, state=22.0))
+        self._drain_states()
+        self.assertEqual(data["sensor_1"][0], 21.5)
+
 
 if __name__ == "__main__":
     unittest.main()
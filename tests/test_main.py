@@ -8,11 +8,12 @@ from solar_controller.main import main
 def mock_inverter():
     inv = MagicMock()
     # Async methods
-    inv.check_connection = AsyncMock(return_value=True)
+    inv.open = AsyncMock()
     inv.read_all_registers = AsyncMock(return_value=None)
     inv.update_poll_registers = AsyncMock(return_value=None)
     inv.update_control_registers = AsyncMock(return_value=None)
     inv.update_status_registers = AsyncMock(return_value=None)
+    inv.close = AsyncMock()
     # Sync methods
     inv.get_registers_as_json.return_value = {"power_ac": 1234.0}
     inv.get_ha_sensors = MagicMock(return_value={})
@@ -34,6 +35,7 @@ def mock_reader():
         "grid_export_power": (50.0, 1234567890.0),
         "last_updated": 1234567890.0,
     }
+    reader.read_control_data = AsyncMock(return_value=reader.get_control_data.return_value)
     reader.get_sensor_data_as_json.return_value = {
         "sensor_1": {"object_id": "sensor_1", "name": "Grid Import", "value": 100, "unit": "W"},
         "sensor_2": {"object_id": "sensor_2", "name": "Grid Export", "value": 50, "unit": "W"},
@@ -61,13 +63,13 @@ async def test_main_loop_runs(mock_inverter, mock_reader):
         mock_reader.ensure_connected.assert_awaited()
 
         # Assert the inverter connection was checked
-        mock_inverter.check_connection.assert_awaited()
+        mock_inverter.open.assert_awaited()
 
         # Assert inverter registers were read at least once
         mock_inverter.read_all_registers.assert_awaited()
 
         # Assert control data was retrieved
-        mock_reader.get_control_data.assert_called()
+        mock_reader.read_control_data.assert_awaited()
 
         # Assert registers were retrieved as JSON
         mock_inverter.get_registers_as_json.assert_called()
@@ -89,3 +91,100 @@ async def test_main_loop_handles_low_pv(mock_inverter, mock_reader):
         # Set very low PV to trigger LOW_PV_THRESHOLD
         scale_factor = regulator.new_scale_factor(current_grid_consumption=50, current_solar_production=10)
         assert scale_factor == 100
+
+
+@pytest.mark.asyncio
+async def test_main_loop_skips_cycle_when_a_read_fails(mock_inverter, mock_reader):
+    stop_event = asyncio.Event()
+    mock_inverter.read_all_registers = AsyncMock(side_effect=ConnectionError("no link"))
+
+    # The skipped cycle sleeps before retrying; end the loop there
+    async def stop_on_sleep(_):
+        stop_event.set()
+
+    with patch("solar_controller.main.create_inverter", return_value=mock_inverter), \
+         patch("solar_controller.main.create_sensor", return_value=mock_reader), \
+         patch("solar_controller.main.asyncio.sleep", side_effect=stop_on_sleep):
+        await main(stop_event=stop_event)
+
+    mock_reader.read_control_data.assert_awaited()
+    mock_inverter.get_registers_as_json.assert_not_called()
+    mock_inverter.close.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_main_loop_continues_after_a_skipped_cycle(mock_inverter, mock_reader):
+    stop_event = asyncio.Event()
+    control_data = mock_reader.read_control_data.return_value
+    mock_reader.read_control_data = AsyncMock(side_effect=[ConnectionError("no link"), control_data])
+    sleeps = []
+
+    # First sleep follows the skipped cycle, the second follows a completed one
+    async def stop_on_second_sleep(_):
+        sleeps.append(_)
+        if len(sleeps) == 2:
+            stop_event.set()
+
+    with patch("solar_controller.main.create_inverter", return_value=mock_inverter), \
+         patch("solar_controller.main.create_sensor", return_value=mock_reader), \
+         patch("solar_controller.main.asyncio.sleep", side_effect=stop_on_second_sleep):
+        await main(stop_event=stop_event)
+
+    assert mock_reader.read_control_data.await_count == 2
+    mock_inverter.get_registers_as_json.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_main_loop_propagates_cancelled_read(mock_inverter, mock_reader):
+    stop_event = asyncio.Event()
+    mock_reader.read_control_data = AsyncMock(side_effect=asyncio.CancelledError())
+
+    with patch("solar_controller.main.create_inverter", return_value=mock_inverter), \
+         patch("solar_controller.main.create_sensor", return_value=mock_reader):
+        with pytest.raises(asyncio.CancelledError):
+            await main(stop_event=stop_event)
+
+    mock_inverter.get_registers_as_json.assert_not_called()
+    mock_inverter.close.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_main_loop_skips_cycle_without_solar_production(mock_inverter, mock_reader):
+    stop_event = asyncio.Event()
+    mock_inverter.get_registers_as_json.return_value = {"power_ac": None}
+    # Valid (int) grid readings, so only the missing solar production can skip the cycle
+    mock_reader.read_control_data = AsyncMock(return_value={
+        "grid_import_power": [100, 1234567890.0],
+        "grid_export_power": [50, 1234567890.0],
+    })
+    regulator = MagicMock()
+    sleeps = []
+
+    # Reaching the cycle's sleep means the loop skipped the cycle instead of failing
+    async def stop_on_sleep(delay):
+        sleeps.append(delay)
+        stop_event.set()
+
+    with patch("solar_controller.main.create_inverter", return_value=mock_inverter), \
+         patch("solar_controller.main.create_sensor", return_value=mock_reader), \
+         patch("solar_controller.main.SolarRegulator", return_value=regulator), \
+         patch("solar_controller.main.asyncio.sleep", side_effect=stop_on_sleep):
+        await main(stop_event=stop_event)
+
+    assert len(sleeps) == 1
+    mock_inverter.get_registers_as_json.assert_called_once()
+    regulator.new_scale_factor.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sleep_until_keeps_schedule_and_reanchors_after_overrun():
+    from solar_controller.main import _sleep_until
+
+    now = asyncio.get_running_loop().time()
+    with patch("solar_controller.main.asyncio.sleep", new=AsyncMock()) as sleep:
+        assert await _sleep_until(now + 5) == now + 5
+        assert sleep.await_args.args[0] == pytest.approx(5, abs=0.5)
+
+        sleep.reset_mock()
+        assert await _sleep_until(now - 3) >= now
+        sleep.assert_not_awaited()
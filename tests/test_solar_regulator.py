@@ -78,3 +78,38 @@ def test_negative_home_consumption(regulator):
     sf = regulator.new_scale_factor(current_grid_consumption=-500, current_solar_production=1000)
     assert 0 <= sf <= 100
     assert regulator.last_limited_power <= 1000
+
+
+# ------------------------
+# Stateless regulation step
+# ------------------------
+def test_compute_limited_power_matches_regulator(regulator):
+    from solar_controller.controller.solar_regulator import compute_limited_power
+
+    regulator.new_scale_factor(current_grid_consumption=1000, current_solar_production=4000)
+    last = regulator.last_limited_power
+    sf = regulator.new_scale_factor(current_grid_consumption=800, current_solar_production=4000)
+
+    limited, expected_sf = compute_limited_power(
+        last, 800.0, 4000.0, regulator.max_step_watt,
+        regulator.MAX_EXPORT_W, regulator.MIN_PRODUCTION_W, regulator.GAIN_SMALL_ERROR,
+    )
+    assert sf == expected_sf
+    assert regulator.last_limited_power == limited
+
+
+def test_steady_state_reuses_previous_result(regulator, monkeypatch):
+    from solar_controller.controller import solar_regulator
+
+    # Converge on constant inputs
+    results = [regulator.new_scale_factor(current_grid_consumption=1000, current_solar_production=4000)
+               for _ in range(200)]
+    assert results[-1] == results[-2]
+
+    monkeypatch.setattr(solar_regulator, "compute_limited_power",
+                        lambda *a: pytest.fail("steady state was recomputed"))
+    assert regulator.new_scale_factor(current_grid_consumption=1000, current_solar_production=4000) == results[-1]
+
+    # Any input change computes again
+    with pytest.raises(pytest.fail.Exception):
+        regulator.new_scale_factor(current_grid_consumption=900, current_solar_production=4000)
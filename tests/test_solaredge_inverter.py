@@ -1,6 +1,15 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from solar_controller.inverter.solaredge_inverter import SolarEdgeInverter
+from pymodbus.register_read_message import ReadHoldingRegistersResponse
+from pymodbus.constants import Endian
+from pymodbus.payload import BinaryPayloadDecoder
+from solaredge_modbus import registerDataType
+from solar_controller.inverter.solaredge_inverter import (
+    SolarEdgeInverter,
+    decode_words,
+    plan_read_blocks,
+    MAX_BLOCK_WORDS,
+)
 from solar_controller.inverter.solaredge_inverter_registers import REGISTERS, PollGroup
 
 
@@ -41,6 +50,17 @@ def test_apply_registers_scaling(inverter):
         assert getattr(inverter, k) is not None
 
 
+def test_apply_registers_scale_values(inverter):
+    raw = {"power_ac": 1234, "power_ac_scale": -1, "energy_total": 5, "energy_total_scale": 3}
+    inverter._apply_registers(raw, ["power_ac", "energy_total"])
+    assert inverter.power_ac == pytest.approx(123.4)
+    assert inverter.energy_total == 5000.0
+
+    # Exponents outside the lookup table still scale correctly
+    inverter._apply_registers({"power_ac": 2, "power_ac_scale": -20}, ["power_ac"])
+    assert inverter.power_ac == pytest.approx(2e-20)
+
+
 def test_apply_registers_invalid_scale_logs_warning(inverter):
     # Find a register with a scale
     scale_reg_name = next((k for k, v in REGISTERS.items() if v.scale), None)
@@ -130,6 +150,304 @@ def test_get_registers_as_json_filtered_by_group(inverter):
             assert k not in json_data
 
 
+def test_print_registers_writes_table(inverter, capsys):
+    inverter.power_ac = 42
+    inverter.print_registers(PollGroup.POLL)
+    out = capsys.readouterr().out
+    assert out.startswith("\nRegister")
+    assert f"{'power_ac':<30} | 42\n" in out
+    assert "c_id" not in out
+
+
+# ------------------------
+# Block reads
+# ------------------------
+def test_plan_read_blocks_merges_small_gaps(inverter):
+    blocks = plan_read_blocks(inverter.registers, ["power_ac", "current", "l1_voltage"])
+    assert len(blocks) == 1
+    block = blocks[0]
+    assert block.start == inverter.registers["current"][0]
+    assert block.count == inverter.registers["power_ac"][0] + 1 - block.start
+    assert [e.name for e in block.entries] == ["current", "l1_voltage", "power_ac"]
+
+
+def test_plan_read_blocks_splits_on_gap_and_size(inverter):
+    blocks = plan_read_blocks(inverter.registers, ["current", "active_power_limit"])
+    assert [b.entries[0].name for b in blocks] == ["current", "active_power_limit"]
+
+    blocks = plan_read_blocks(inverter.registers, list(inverter.registers), max_gap=0)
+    assert all(b.count <= MAX_BLOCK_WORDS for b in blocks)
+    for block in blocks:
+        for entry in block.entries:
+            assert entry.offset + entry.length <= block.count
+
+
+@pytest.mark.parametrize("dtype,words", [
+    (registerDataType.UINT16, [0x1234]),
+    (registerDataType.INT16, [0xFFFE]),
+    (registerDataType.INT16, [0x8000]),  # not implemented
+    (registerDataType.UINT32, [0x0001, 0x0002]),
+    (registerDataType.ACC32, [0x1234, 0x5678]),
+    (registerDataType.INT32, [0xFFFF, 0xFFFE]),
+    (registerDataType.UINT64, [0, 1, 2, 3]),
+    (registerDataType.FLOAT32, [0x3F80, 0x0000]),
+    (registerDataType.STRING, [0x5345, 0x2D31, 0x0000, 0x0000]),
+])
+def test_decode_words_matches_library_decoder(inverter, dtype, words):
+    vtype = str if dtype == registerDataType.STRING else int
+    decoder = BinaryPayloadDecoder.fromRegisters(words, byteorder=Endian.BIG, wordorder=Endian.BIG)
+    expected = inverter._decode_value(decoder, len(words), dtype, vtype)
+    assert decode_words([0] + words, 1, len(words), dtype, vtype) == expected
+
+
+def test_block_decode_matches_per_register_decoders(inverter):
+    import array
+    import random
+
+    rng = random.Random(0)
+    for block in inverter._all_blocks:
+        assert block.layout is not None
+        words = array.array("H", (rng.randrange(0x10000) for _ in range(block.count + 2)))
+        expected = {e.name: e.decode(words, 2) for e in block.entries}
+        decoded = block.decode(words, 2)
+        assert decoded.keys() == expected.keys()
+        for name, value in expected.items():
+            assert decoded[name] == value or (value != value and decoded[name] != decoded[name])
+
+
+def test_group_blocks_cover_group_registers(inverter):
+    for group in PollGroup:
+        names = {e.name for b in inverter._group_blocks[group] for e in b.entries}
+        assert names == {r for r, v in REGISTERS.items() if v.group == group}
+
+
+def test_sync_update_register_group_decodes_block(inverter):
+    block = inverter._group_blocks[PollGroup.POLL][0]
+    words = [0] * block.count
+    offsets = {e.name: e.offset for e in block.entries}
+    words[offsets["power_ac"]] = 1234
+    words[offsets["power_ac_scale"]] = 0xFFFF  # -1
+
+    inverter.connect = MagicMock()
+    inverter.disconnect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.client = MagicMock()
+    inverter.client.read_holding_registers.return_value = ReadHoldingRegistersResponse(words)
+
+    data = inverter._sync_update_register_group(PollGroup.POLL)
+
+    inverter.client.read_holding_registers.assert_called_once_with(block.start, block.count, slave=inverter.unit)
+    assert data["power_ac"] == 1234
+    assert data["power_ac_scale"] == -1
+
+
+def test_sync_read_all_registers_uses_block_reads(inverter):
+    inverter.connect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.client = MagicMock()
+    inverter.client.read_holding_registers.side_effect = (
+        lambda start, count, slave: ReadHoldingRegistersResponse([0] * count)
+    )
+    inverter.read_all = MagicMock()
+
+    data = inverter._sync_read_all_registers()
+
+    inverter.read_all.assert_not_called()
+    assert inverter.client.read_holding_registers.call_count == len(inverter._all_blocks)
+    assert set(data) == set(REGISTERS)
+
+
+def test_control_group_reads_active_power_limit(inverter):
+    inverter.connect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.client = MagicMock()
+    inverter.client.read_holding_registers.return_value = ReadHoldingRegistersResponse([75])
+
+    data = inverter._sync_update_register_group(PollGroup.CONTROL)
+
+    inverter.client.read_holding_registers.assert_called_once_with(61441, 1, slave=inverter.unit)
+    inverter._apply_registers(data, data.keys())
+    assert inverter.get_control_data()["power_limit"] == 75
+
+
+@pytest.mark.asyncio
+async def test_read_all_registers_keeps_values_when_a_block_fails(inverter):
+    inverter.connect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.client = MagicMock()
+    first_block = inverter._all_blocks[0]
+    inverter.power_ac = 1500.0
+    inverter.last_updated = 1.0
+
+    # The identity + poll block fails on every retry, the other blocks read fine
+    def read(start, count, slave):
+        if start == first_block.start:
+            raise IOError("timeout")
+        return ReadHoldingRegistersResponse([0] * count)
+
+    inverter.client.read_holding_registers.side_effect = read
+    await inverter.read_all_registers()
+
+    assert "power_ac" in {e.name for e in first_block.entries}
+    assert inverter.power_ac == 1500.0
+    assert inverter.last_updated > 1.0
+
+    # Nothing read at all: the data is not reported as fresh
+    inverter.client.read_holding_registers.side_effect = IOError("timeout")
+    inverter.last_updated = 1.0
+    await inverter.read_all_registers()
+    assert inverter.power_ac == 1500.0
+    assert inverter.last_updated == 1.0
+
+
+def test_sync_update_register_group_keeps_values_of_failed_block(inverter):
+    inverter.connect = MagicMock()
+    inverter.disconnect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.client = MagicMock()
+    inverter.client.read_holding_registers.side_effect = IOError("timeout")
+    inverter.power_ac = 1500.0
+
+    data = inverter._sync_update_register_group(PollGroup.POLL)
+
+    assert "power_ac" not in data
+    assert inverter.client.read_holding_registers.call_count == (
+        inverter.retries * len(inverter._group_blocks[PollGroup.POLL])
+    )
+    inverter.logger.error.assert_called()
+    inverter._apply_registers(data, REGISTERS.keys())
+    assert inverter.power_ac == 1500.0
+
+
+def test_sync_update_register_group_retries_transient_error(inverter):
+    block = inverter._group_blocks[PollGroup.POLL][0]
+    words = [0] * block.count
+    offsets = {e.name: e.offset for e in block.entries}
+    words[offsets["power_ac"]] = 1234
+
+    inverter.connect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.client = MagicMock()
+    inverter.client.read_holding_registers.side_effect = [IOError("timeout"), ReadHoldingRegistersResponse(words)]
+    inverter._group_blocks = {PollGroup.POLL: [block]}
+
+    data = inverter._sync_update_register_group(PollGroup.POLL)
+
+    assert data["power_ac"] == 1234
+    inverter.logger.error.assert_not_called()
+
+
+def test_block_layout_pads_registers_longer_than_their_type(inverter):
+    import array
+
+    # advanced_power_control_enable is a UINT16 declared as 2 words; place a register right after it
+    enable = inverter.registers["advanced_power_control_enable"]
+    register_map = {
+        "advanced_power_control_enable": enable,
+        "next_register": (enable[0] + 2, 2, enable[2], registerDataType.INT32, int),
+    }
+    block = plan_read_blocks(register_map, list(register_map))[0]
+    assert block.layout is not None
+    assert block.layout.size == 2 * block.count
+
+    words = array.array("H", [0x0001, 0x0000, 0x0002, 0x0003])
+    assert block.decode(words, 0) == {e.name: e.decode(words, 0) for e in block.entries}
+    assert block.decode(words, 0)["next_register"] == 0x00020003
+
+
+# ------------------------
+# Persistent connection
+# ------------------------
+def test_session_connects_once_and_reuses_connection(inverter):
+    inverter.connect = MagicMock()
+    inverter.disconnect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+
+    with inverter._session():
+        pass
+    with inverter._session():
+        pass
+
+    inverter.connect.assert_called_once()
+    inverter.disconnect.assert_not_called()
+
+
+def test_session_drops_connection_on_error(inverter):
+    inverter.connect = MagicMock()
+    inverter.disconnect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+
+    with pytest.raises(IOError):
+        with inverter._session():
+            raise IOError("boom")
+
+    inverter.disconnect.assert_called_once()
+    assert inverter._connected is False
+
+
+def test_connect_disables_nagle_over_tcp(inverter):
+    import socket
+    import solaredge_modbus
+
+    inverter.mode = solaredge_modbus.connectionType.TCP
+    inverter.client = MagicMock()
+    inverter.client.connect.return_value = True
+
+    assert inverter.connect() is True
+    inverter.client.socket.setsockopt.assert_called_once_with(
+        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+    )
+
+
+def test_connect_leaves_serial_socket_untouched(inverter):
+    inverter.client = MagicMock()
+    inverter.client.connect.return_value = True
+
+    inverter.connect()
+    inverter.client.socket.setsockopt.assert_not_called()
+
+
+def test_open_raises_when_connect_fails(inverter):
+    inverter.connect = MagicMock()
+    inverter.connected = MagicMock(return_value=False)
+    inverter.disconnect = MagicMock()
+    with pytest.raises(ConnectionError):
+        inverter._sync_open()
+    assert inverter._connected is False
+
+
+def test_open_keeps_session_for_first_read(inverter):
+    inverter.connect = MagicMock()
+    inverter.connected = MagicMock(return_value=True)
+    inverter.disconnect = MagicMock()
+    inverter._sync_open()
+    assert inverter._connected is True
+    inverter.disconnect.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_modbus_calls_run_on_dedicated_executor(inverter):
+    import threading
+
+    thread_names = []
+    inverter._sync_set_production_limit = lambda limit: thread_names.append(threading.current_thread().name)
+
+    await inverter.set_production_limit(10)
+    assert thread_names[0].startswith("modbus")
+
+
+@pytest.mark.asyncio
+async def test_close_drops_connection_and_shuts_down_executor(inverter):
+    inverter.disconnect = MagicMock()
+    inverter._connected = True
+
+    await inverter.close()
+
+    inverter.disconnect.assert_called_once()
+    assert inverter._connected is False
+    assert inverter._executor._shutdown
+
+
 # ------------------------
 # Async update methods
 # ------------------------
@@ -170,3 +488,97 @@ async def test_restore_power_control_defaults_calls_sync(inverter):
     inverter._sync_restore_defaults = MagicMock()
     await inverter.restore_power_control_defaults()
     inverter._sync_restore_defaults.assert_called_once()
+
+
+def test_register_values_stored_in_values_dict(inverter):
+    inverter.power_ac = 12.5
+    assert inverter._values["power_ac"] == 12.5
+    assert "power_ac" not in vars(inverter)
+
+    inverter._apply_registers({"power_ac": 100, "power_ac_scale": -1}, ["power_ac"])
+    assert inverter.power_ac == pytest.approx(10.0)
+
+    with pytest.raises(AttributeError):
+        _ = inverter.not_a_register
+
+
+def test_get_registers_as_bytes_matches_json(inverter):
+    import json
+
+    inverter.power_ac = 1234.5
+    inverter.c_serialnumber = "7E0A1B2C"
+    data = inverter.get_registers_as_bytes(group=PollGroup.POLL)
+    assert json.loads(data) == inverter.get_registers_as_json(group=PollGroup.POLL)
+    assert json.loads(inverter.get_registers_as_bytes())["c_serialnumber"] == "7E0A1B2C"
+
+
+def test_apply_registers_publishes_new_snapshot(inverter):
+    before = inverter._values
+    before_power = before["power_ac"]
+    inverter._apply_registers({"power_ac": 500, "power_ac_scale": 0}, ["power_ac"])
+
+    assert inverter._values is not before
+    assert before["power_ac"] == before_power
+    assert inverter.power_ac == 500.0
+
+
+def test_register_setattr_publishes_new_snapshot(inverter):
+    before = inverter._values
+    before_power = before["power_ac"]
+    inverter.power_ac = 750.0
+
+    assert inverter._values is not before
+    assert before["power_ac"] == before_power
+    assert inverter.power_ac == 750.0
+
+
+def test_json_bytes_cached_until_registers_change(inverter):
+    import json
+
+    inverter.power_ac = 100.0
+    first = inverter.get_ha_sensors_as_bytes()
+    assert inverter.get_ha_sensors_as_bytes() is first
+    assert json.loads(first)["power_ac"]["state"] == 100.0
+
+    inverter.power_ac = 200.0
+    assert json.loads(inverter.get_ha_sensors_as_bytes())["power_ac"]["state"] == 200.0
+
+
+def test_register_group_partitions():
+    from solar_controller.inverter.solaredge_inverter_registers import (
+        HA_REGISTERS_BY_GROUP,
+        REGISTER_NAMES_BY_GROUP,
+        REGISTERS_BY_GROUP,
+        SCALE_OF,
+    )
+
+    assert sum(len(regs) for regs in REGISTERS_BY_GROUP.values()) == len(REGISTERS)
+    for group, names in REGISTER_NAMES_BY_GROUP.items():
+        assert names == tuple(n for n, reg in REGISTERS.items() if reg.group == group)
+    assert SCALE_OF == {name: reg.scale for name, reg in REGISTERS.items() if reg.scale}
+    for group, regs in HA_REGISTERS_BY_GROUP.items():
+        for name, reg in regs.items():
+            assert reg.group == group and reg.ha and not name.endswith("_scale")
+
+
+def test_block_plans_shared_between_instances(inverter):
+    other = SolarEdgeInverter(device="/dev/null")
+    assert other._group_blocks is inverter._group_blocks
+    assert other._all_blocks is inverter._all_blocks
+
+
+def test_get_ha_sensors_reuses_template_until_serial_changes(inverter):
+    inverter.c_serialnumber = "ABC"
+    inverter.power_ac = 10.0
+    first = inverter.get_ha_sensors(PollGroup.POLL)
+    assert first["power_ac"]["state"] == 10.0
+    assert first["power_ac"]["unique_id"] == "ABC_power_ac"
+    assert next(iter(first["power_ac"])) == "state"
+
+    inverter.power_ac = None
+    second = inverter.get_ha_sensors(PollGroup.POLL)
+    assert second["power_ac"]["available"] is False
+    assert second["power_ac"] is not first["power_ac"]
+
+    inverter.c_serialnumber = "XYZ"
+    assert inverter.get_ha_sensors(PollGroup.POLL)["power_ac"]["unique_id"] == "XYZ_power_ac"